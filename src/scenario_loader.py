@@ -22,11 +22,16 @@ Design notes
   path and returns a validated, normalized `Scenario` object.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 import difflib
+from itertools import chain, islice
 import json
 from pathlib import Path
-from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+from sys import intern
+from types import MappingProxyType
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+import numpy as np
+# Imported eagerly: Phase1Bundle (phase1_data) already requires pandas, so a lazy import would not save startup time
 import pandas as pd
 
 import yaml
@@ -58,9 +63,10 @@ class RunSpecs:
 class Scenario:
     name: str
     runspecs: RunSpecs
-    # Strictly validated and normalized
-    constants: Dict[str, float]
-    points: Dict[str, List[Tuple[float, float]]]
+    # Strictly validated and normalized; exposed as read-only mappings
+    constants: Mapping[str, float]
+    # Lookup points are read-only after validation; stored as tuple-of-pairs
+    points: Mapping[str, Tuple[Tuple[float, float], ...]]
     # Phase 13: primary_map overrides (sector -> list[(material, start_year)])
     primary_map: Dict[str, List[Tuple[str, float]]] | None = None
     # Optional: SM universe supplied by scenario (Phase 17.x extension)
@@ -85,11 +91,76 @@ class Scenario:
     # SM-mode: mapping of sector -> material -> total completed projects pre-t0
     seeds_completed_projects_sm: Dict[str, Dict[str, int]] | None = None
 
+    def __reduce__(self):
+        # MappingProxyType can be neither pickled nor deep-copied; ship plain dicts and rewrap them on load
+        state = {f.name: getattr(self, f.name) for f in fields(self)}
+        state["constants"] = dict(self.constants)
+        state["points"] = dict(self.points)
+        return (_rebuild_scenario, (state,))
+
+
+def _rebuild_scenario(state: Dict[str, object]) -> Scenario:
+    state["constants"] = MappingProxyType(state["constants"])
+    state["points"] = MappingProxyType(state["points"])
+    return Scenario(**state)
+
 
 DEFAULT_START = 2025.0
 DEFAULT_STOP = 2032.0
 DEFAULT_DT = 0.25
 
+# Per-(sector, material) anchor params that SM-mode requires full coverage for
+_TARGETED_SM_PARAMS: frozenset[str] = frozenset(
+    {
+        "anchor_start_year",
+        "anchor_client_activation_delay",
+        "anchor_lead_generation_rate",
+        "lead_to_pc_conversion_rate",
+        "project_generation_rate",
+        "max_projects_per_pc",
+        "project_duration",
+        "projects_to_client_conversion",
+        "initial_phase_duration",
+        "ramp_phase_duration",
+        "ATAM",
+        "initial_requirement_rate",
+        "initial_req_growth",
+        "ramp_requirement_rate",
+        "ramp_req_growth",
+        "steady_requirement_rate",
+        "steady_req_growth",
+        "requirement_to_order_lag",
+        "requirement_limit_multiplier",
+    }
+)
+# Override parameters for phase transitions (optional per pair)
+_PHASE_OVERRIDE_SM_PARAMS: frozenset[str] = frozenset({"ramp_requirement_rate_override", "steady_requirement_rate_override"})
+# Overridable per-(s,m) params: full anchor set in SM-mode, requirement params only in sector-mode
+_SM_MODE_SM_PARAMS: frozenset[str] = _TARGETED_SM_PARAMS | _PHASE_OVERRIDE_SM_PARAMS
+_SECTOR_MODE_SM_PARAMS: frozenset[str] = (
+    frozenset(
+        {
+            "requirement_to_order_lag",
+            "initial_requirement_rate",
+            "initial_req_growth",
+            "ramp_requirement_rate",
+            "ramp_req_growth",
+            "steady_requirement_rate",
+            "steady_req_growth",
+        }
+    )
+    | _PHASE_OVERRIDE_SM_PARAMS
+)
+
+# Per-bundle bound on memoized permissible key sets (distinct anchor_mode/extra-pairs combinations)
+_PERMISSIBLE_KEYS_CACHE_SIZE = 8
+
+# Number of uncovered (sector, material, param) triples listed in SM-mode coverage errors
+_MISSING_PREVIEW_LIMIT = 10
+
+# Seed blocks validated against the (sector, material) universe in SM-mode
+_SM_SEED_BLOCKS = frozenset({"active_anchor_clients_sm", "completed_projects_sm", "elapsed_quarters_sm"})
+
 
 def _coerce_numeric(value: object, field_name: str) -> float:
     """Attempt to coerce an object to a primitive float, stripping simple symbols.
@@ -114,12 +185,36 @@ def _coerce_numeric(value: object, field_name: str) -> float:
     raise ValueError(f"Non-numeric value for '{field_name}': {value!r}")
 
 
-def _coerce_points(points: Sequence[Sequence[object]], lookup_name: str) -> List[Tuple[float, float]]:
+def _coerce_non_negative_ints(raw_values: Sequence[object], field_names: Sequence[str]) -> List[int]:
+    """Coerce seed counts to non-negative integers in one vectorized check.
+
+    Each value is coerced with `_coerce_numeric` (so numeric strings remain
+    accepted); the non-negativity and integrality checks then run once over a
+    NumPy array. The first offending entry, in input order, is reported, but
+    only after every value has been coerced, so a non-numeric value is
+    reported ahead of an earlier negative or fractional one. Callers check all
+    keys of a block before any value.
+    """
+    if not raw_values:
+        return []
+    arr = np.fromiter(
+        (_coerce_numeric(v, f) for v, f in zip(raw_values, field_names)), dtype=np.float64, count=len(raw_values)
+    )
+    bad = np.flatnonzero(~np.isfinite(arr) | (arr < 0) | (np.floor(arr) != arr))
+    if bad.size:
+        raise ValueError(f"{field_names[bad[0]]} must be a non-negative integer")
+    # Python ints rather than an int64 cast, which would wrap counts above 2**63 - 1
+    return [int(x) for x in arr]
+
+
+def _coerce_points(points: Sequence[Sequence[object]], lookup_name: str) -> Tuple[Tuple[float, float], ...]:
     """Validate and normalize a list of [time, value] pairs to sorted floats.
 
     The function is deliberately strict about structure and monotonicity to
     prevent subtle runtime errors in lookups that expect a well-behaved time
     axis in BPTK_Py. We sort by time and require strictly increasing times.
+    The result is an immutable tuple of pairs since points are read-only
+    downstream.
     """
     normalized: List[Tuple[float, float]] = []
     for idx, pair in enumerate(points):
@@ -135,10 +230,12 @@ def _coerce_points(points: Sequence[Sequence[object]], lookup_name: str) -> List
     normalized.sort(key=lambda x: x[0])
     for i in range(1, len(normalized)):
         if normalized[i][0] <= normalized[i - 1][0]:
+            # Report only the first offending pair so the message stays bounded for long lookups
             raise ValueError(
-                f"Points for '{lookup_name}' must have strictly increasing time values; offending sequence: {normalized}"
+                f"Points for '{lookup_name}' must have strictly increasing time values; first violation at index {i}: "
+                f"t[{i - 1}]={normalized[i - 1][0]}, t[{i}]={normalized[i][0]}"
             )
-    return normalized
+    return tuple(normalized)
 
 
 def _nearest_matches(name: str, candidates: Iterable[str], n: int = 3) -> List[str]:
@@ -147,12 +244,36 @@ def _nearest_matches(name: str, candidates: Iterable[str], n: int = 3) -> List[s
 
 def _collect_permissible_override_keys(
     bundle: Phase1Bundle, *, anchor_mode: str = "sector", extra_sm_pairs: Optional[List[Tuple[str, str]]] = None
-) -> Tuple[set, set]:
+) -> Tuple[frozenset[str], frozenset[str]]:
     """Return (constants_keys, points_keys) permissible for overrides.
 
     - constants_keys include anchor param × sector and other param × material
     - points_keys include price_<material> and max_capacity_<material>
+
+    Results are memoized per bundle instance, keyed by anchor mode and the set
+    of extra (sector, material) pairs, and returned as frozensets so cached
+    values can be shared safely.
     """
+    cache = getattr(bundle, "_permissible_keys_cache", None)
+    if cache is None:
+        cache = {}
+        bundle._permissible_keys_cache = cache  # type: ignore[attr-defined]
+    key = (anchor_mode, tuple(sorted(set(extra_sm_pairs or ()))))
+    cached = cache.get(key)
+    if cached is None:
+        constants, points = _build_permissible_override_keys(bundle, anchor_mode=anchor_mode, extra_sm_pairs=extra_sm_pairs)
+        cached = (frozenset(constants), frozenset(points))
+        if len(cache) >= _PERMISSIBLE_KEYS_CACHE_SIZE:
+            # Evict the oldest entry; dicts preserve insertion order
+            cache.pop(next(iter(cache)))
+        cache[key] = cached
+    return cached
+
+
+def _build_permissible_override_keys(
+    bundle: Phase1Bundle, *, anchor_mode: str, extra_sm_pairs: Optional[List[Tuple[str, str]]]
+) -> Tuple[set, set]:
+    """Uncached builder behind `_collect_permissible_override_keys`."""
     # Build the complete set of constants and lookup names that a scenario is
     # allowed to override, based exclusively on the Phase 1 inputs. This keeps
     # Phase 3 validation independent of the SD model build order.
@@ -180,54 +301,17 @@ def _collect_permissible_override_keys(
     # Per-(sector, material) anchor params (Phase 16/17):
     # - In sector-mode: allow targeted params to be overridden per (s,m)
     # - In SM-mode: allow the FULL anchor set per (s,m) listed in Phase 17.1
-    if anchor_mode == "sm":
-        sm_params = {
-            "anchor_start_year",
-            "anchor_client_activation_delay",
-            "anchor_lead_generation_rate",
-            "lead_to_pc_conversion_rate",
-            "project_generation_rate",
-            "max_projects_per_pc",
-            "project_duration",
-            "projects_to_client_conversion",
-            "initial_phase_duration",
-            "ramp_phase_duration",
-            "ATAM",
-            "initial_requirement_rate",
-            "initial_req_growth",
-            "ramp_requirement_rate",
-            "ramp_req_growth",
-            "steady_requirement_rate",
-            "steady_req_growth",
-            "requirement_to_order_lag",
-            "requirement_limit_multiplier",
-            # NEW: Override parameters for phase transitions
-            "ramp_requirement_rate_override",
-            "steady_requirement_rate_override",
-        }
-    else:
-        sm_params = {
-            "requirement_to_order_lag",
-            "initial_requirement_rate",
-            "initial_req_growth",
-            "ramp_requirement_rate",
-            "ramp_req_growth",
-            "steady_requirement_rate",
-            "steady_req_growth",
-            # NEW: Override parameters for phase transitions
-            "ramp_requirement_rate_override",
-            "steady_requirement_rate_override",
-        }
+    sm_params = _SM_MODE_SM_PARAMS if anchor_mode == "sm" else _SECTOR_MODE_SM_PARAMS
     # SM universe from lists_sm if available, else derive from primary_map; include extra pairs from scenario overrides
     sm_df_universe = getattr(bundle, "lists_sm", None)
     if sm_df_universe is None or sm_df_universe.empty:
-        sm_df_universe = bundle.primary_map.long[["Sector", "Material"]].drop_duplicates()
-    if extra_sm_pairs:
-        extra_df = pd.DataFrame(extra_sm_pairs, columns=["Sector", "Material"]).drop_duplicates()
-        sm_df_universe = pd.concat([sm_df_universe, extra_df], ignore_index=True).drop_duplicates()
-    for _, sm in sm_df_universe.iterrows():
-        s = str(sm.get("Sector")).strip()
-        m = str(sm.get("Material")).strip()
+        sm_df_universe = bundle.primary_map.long[["Sector", "Material"]]
+    # Order-preserving dedup of universe + extra pairs in one pass (dict keys keep insertion order)
+    sm_pairs = dict.fromkeys(
+        (str(s).strip(), str(m).strip())
+        for s, m in chain(zip(sm_df_universe["Sector"], sm_df_universe["Material"]), extra_sm_pairs or ())
+    )
+    for s, m in sm_pairs:
         for p in sm_params:
             constants.add(anchor_constant_sm(p, s, m))
 
@@ -240,26 +324,82 @@ def _collect_permissible_override_keys(
 
 
 def _sm_constants_from_overrides(
-    constants: Mapping[str, float], bundle: Phase1Bundle, params: set[str]
+    constants: Mapping[str, float], sm_pairs: Iterable[Tuple[str, str]], params: Iterable[str]
 ) -> set[Tuple[str, str, str]]:
     """Return set of (Sector, Material, Param) triples that are present in scenario overrides.
 
     This helps SM-mode consider scenario-provided constants as satisfying coverage, even if
-    `inputs.json` lacks those triples.
+    `inputs.json` lacks those triples. Only the pairs being checked (`sm_pairs`) are probed.
     """
-    # Build SM universe from explicit lists_sm if present; else derive from primary_map
-    sm_df_universe = getattr(bundle, "lists_sm", None)
-    if sm_df_universe is None or sm_df_universe.empty:
-        sm_df_universe = bundle.primary_map.long[["Sector", "Material"]].drop_duplicates()
-    found: set[Tuple[str, str, str]] = set()
-    for _, sm in sm_df_universe.iterrows():
-        s = str(sm["Sector"]).strip()
-        m = str(sm["Material"]).strip()
-        for p in params:
-            name = anchor_constant_sm(p, s, m)
-            if name in constants:
-                found.add((s, m, p))
-    return found
+    if not constants:
+        return set()
+    return {(s, m, p) for s, m in sm_pairs for p in params if anchor_constant_sm(p, s, m) in constants}
+
+
+def _build_sm_allowed_pairs(
+    bundle: Phase1Bundle, scenario_sm_pairs: Optional[Sequence[Tuple[str, str]]]
+) -> frozenset[Tuple[str, str]]:
+    """Return the strict SM universe as a frozenset of (Sector, Material) pairs.
+
+    Scenario-provided `lists_sm` pairs take precedence. Otherwise the bundle's
+    `lists_sm` is used and must be non-empty and explicitly provided in inputs.json.
+    Built once per scenario and shared by all SM-mode validators.
+    """
+    if scenario_sm_pairs:
+        return frozenset((intern(str(s).strip()), intern(str(m).strip())) for s, m in scenario_sm_pairs)
+    sm_df = getattr(bundle, "lists_sm", None)
+    if sm_df is None or sm_df.empty:
+        raise ValueError("SM-mode requires non-empty lists_sm (provide via scenario or inputs.json)")
+    if not getattr(bundle, "lists_sm_explicit", False):
+        raise ValueError("SM-mode requires lists_sm be explicitly provided (scenario or inputs.json), not derived")
+    return frozenset(
+        zip(
+            map(intern, sm_df["Sector"].astype(str).str.strip()),
+            map(intern, sm_df["Material"].astype(str).str.strip()),
+        )
+    )
+
+
+def _anchor_sm_triples(bundle: Phase1Bundle) -> frozenset[Tuple[str, str, str]]:
+    """Return the (Sector, Material, Param) triples present in `bundle.anchor_sm`.
+
+    Normalized with vectorized `.str.strip()` and cached on the bundle so the
+    DataFrame is scanned once per bundle rather than once per scenario.
+    """
+    cached = getattr(bundle, "_anchor_sm_triples", None)
+    if cached is None:
+        df = getattr(bundle, "anchor_sm", None)
+        if df is None or df.empty:
+            cached = frozenset()
+        else:
+            cached = frozenset(
+                zip(
+                    map(intern, df["Sector"].astype(str).str.strip()),
+                    map(intern, df["Material"].astype(str).str.strip()),
+                    map(intern, df["Param"].astype(str).str.strip()),
+                )
+            )
+        bundle._anchor_sm_triples = cached  # type: ignore[attr-defined]
+    return cached
+
+
+def _missing_sm_triples(
+    sm_pairs: Iterable[Tuple[str, str]], available: frozenset[Tuple[str, str, str]], params: Iterable[str]
+) -> pd.MultiIndex:
+    """Return the (Sector, Material, Param) triples required in SM-mode but not in `available`.
+
+    The required surface is the cross-join of the SM universe with `params`;
+    gaps are found with one `MultiIndex.difference` instead of a nested Python loop.
+    """
+    names = ["Sector", "Material", "Param"]
+    required = pd.DataFrame(sorted(sm_pairs), columns=["Sector", "Material"]).merge(
+        pd.DataFrame({"Param": sorted(params)}), how="cross"
+    )
+    required_idx = pd.MultiIndex.from_frame(required, names=names)
+    if not available:
+        return required_idx
+    available_idx = pd.MultiIndex.from_tuples(list(available), names=names)
+    return required_idx.difference(available_idx, sort=False)
 
 
 def _validate_seeds(
@@ -282,24 +422,22 @@ def _validate_seeds(
     if not isinstance(raw_seeds, Mapping):
         raise ValueError("'seeds' must be a mapping with 'active_anchor_clients' and optional 'elapsed_quarters'")
 
-    sectors_set = set(map(str, bundle.lists.sectors))
+    sectors_set, _ = _bundle_name_sets(bundle)
 
     def _normalize_counts(block: Optional[Mapping[str, object]], block_name: str) -> Dict[str, int]:
         if block is None:
             return {}
         if not isinstance(block, Mapping):
             raise ValueError(f"'seeds.{block_name}' must be a mapping of sector -> non-negative integer")
-        out: Dict[str, int] = {}
-        for sector, raw_val in block.items():
+        keys: List[str] = []
+        for sector in block.keys():
             s = str(sector)
             if s not in sectors_set:
                 raise ValueError(f"seeds.{block_name} contains unknown sector '{s}'")
-            # Accept ints, numeric strings; coerce via _coerce_numeric then check integer-ness
-            v_float = _coerce_numeric(raw_val, f"seeds.{block_name}['{s}']")
-            if v_float < 0 or int(v_float) != v_float:
-                raise ValueError(f"seeds.{block_name}['{s}'] must be a non-negative integer")
-            out[s] = int(v_float)
-        return out
+            keys.append(s)
+        # Accept ints, numeric strings; coerce then check integer-ness in one pass
+        counts = _coerce_non_negative_ints(list(block.values()), [f"seeds.{block_name}['{s}']" for s in keys])
+        return dict(zip(keys, counts))
 
     active_map = _normalize_counts(raw_seeds.get("active_anchor_clients"), "active_anchor_clients")
     elapsed_map = _normalize_counts(raw_seeds.get("elapsed_quarters"), "elapsed_quarters")
@@ -322,7 +460,11 @@ def _validate_seeds(
 
 
 def _validate_seeds_sm(
-    raw_seeds: Optional[Mapping[str, object]], *, bundle: Phase1Bundle, anchor_mode: str
+    raw_seeds: Optional[Mapping[str, object]],
+    *,
+    bundle: Phase1Bundle,
+    anchor_mode: str,
+    allowed_pairs: Optional[frozenset[Tuple[str, str]]] = None,
 ) -> Dict[str, Dict[str, int]]:
     """Phase 17.1: Validate SM-mode seeding configuration.
 
@@ -341,29 +483,13 @@ def _validate_seeds_sm(
     if not isinstance(block, Mapping):
         raise ValueError("seeds.active_anchor_clients_sm must be a mapping of sector -> mapping(material -> int)")
 
-    # Build SM universe. Allow scenario-level lists_sm to satisfy this requirement when present.
-    # The scenario-level lists_sm is parsed earlier in load_and_validate_scenario and stored temporarily
-    # on a private key in the seeds block for validation purposes.
-    import pandas as pd
-
-    scenario_sm_pairs: List[Tuple[str, str]] | None = None
-    if isinstance(raw_seeds, Mapping):
-        scenario_sm_pairs = raw_seeds.get("__scenario_lists_sm__")  # type: ignore[assignment]
-    sm_df = None
-    if scenario_sm_pairs:
-        sm_df = pd.DataFrame(scenario_sm_pairs, columns=["Sector", "Material"]).drop_duplicates()
-    else:
-        sm_df = getattr(bundle, "lists_sm", None)
-        if sm_df is None or sm_df.empty:
-            raise ValueError("SM-mode requires non-empty lists_sm (provide via scenario.lists_sm or inputs.json)")
-        # If coming from inputs.json, enforce explicitness to avoid derived lists
-        if not getattr(bundle, "lists_sm_explicit", False):
-            raise ValueError("SM-mode requires lists_sm be explicitly provided (scenario or inputs.json), not derived")
-
-    # Allowed pairs set
-    allowed_pairs = {(str(r["Sector"]), str(r["Material"])) for _, r in sm_df.iterrows()}
+    # SM universe: callers pass the shared set; otherwise build it from the scenario-level
+    # lists_sm injected on a private key in the seeds block, falling back to bundle.lists_sm.
+    if allowed_pairs is None:
+        allowed_pairs = _build_sm_allowed_pairs(bundle, raw_seeds.get("__scenario_lists_sm__"))  # type: ignore[arg-type]
 
-    out: Dict[str, Dict[str, int]] = {}
+    pairs: List[Tuple[str, str]] = []
+    raw_values: List[object] = []
     for sector, mat_map in block.items():
         s = str(sector)
         if not isinstance(mat_map, Mapping):
@@ -372,10 +498,12 @@ def _validate_seeds_sm(
             m = str(material)
             if (s, m) not in allowed_pairs:
                 raise ValueError(f"seeds.active_anchor_clients_sm contains unknown pair ('{s}', '{m}') not in lists_sm")
-            v_float = _coerce_numeric(raw_val, f"seeds.active_anchor_clients_sm['{s}']['{m}']")
-            if v_float < 0 or int(v_float) != v_float:
-                raise ValueError(f"seeds.active_anchor_clients_sm['{s}']['{m}'] must be a non-negative integer")
-            out.setdefault(s, {})[m] = int(v_float)
+            pairs.append((s, m))
+            raw_values.append(raw_val)
+    counts = _coerce_non_negative_ints(raw_values, [f"seeds.active_anchor_clients_sm['{s}']['{m}']" for s, m in pairs])
+    out: Dict[str, Dict[str, int]] = {}
+    for (s, m), count in zip(pairs, counts):
+        out.setdefault(s, {})[m] = count
     return out
 
 
@@ -402,21 +530,23 @@ def _validate_completed_projects(
         return {}
     if not isinstance(block, Mapping):
         raise ValueError("seeds.completed_projects must be a mapping of sector -> non-negative integer")
-    sectors_set = set(map(str, bundle.lists.sectors))
-    out: Dict[str, int] = {}
-    for sector, raw_val in block.items():
+    sectors_set, _ = _bundle_name_sets(bundle)
+    keys: List[str] = []
+    for sector in block.keys():
         s = str(sector)
         if s not in sectors_set:
             raise ValueError(f"seeds.completed_projects contains unknown sector '{s}'")
-        v_float = _coerce_numeric(raw_val, f"seeds.completed_projects['{s}']")
-        if v_float < 0 or int(v_float) != v_float:
-            raise ValueError(f"seeds.completed_projects['{s}'] must be a non-negative integer")
-        out[s] = int(v_float)
-    return out
+        keys.append(s)
+    counts = _coerce_non_negative_ints(list(block.values()), [f"seeds.completed_projects['{s}']" for s in keys])
+    return dict(zip(keys, counts))
 
 
 def _validate_completed_projects_sm(
-    raw_seeds: Optional[Mapping[str, object]], *, bundle: Phase1Bundle, anchor_mode: str
+    raw_seeds: Optional[Mapping[str, object]],
+    *,
+    bundle: Phase1Bundle,
+    anchor_mode: str,
+    allowed_pairs: Optional[frozenset[Tuple[str, str]]] = None,
 ) -> Dict[str, Dict[str, int]]:
     """Validate SM-mode completed projects backlog per (sector, material).
 
@@ -434,22 +564,11 @@ def _validate_completed_projects_sm(
         return {}
     if not isinstance(block, Mapping):
         raise ValueError("seeds.completed_projects_sm must be a mapping of sector -> mapping(material -> int)")
-    # Use scenario-provided lists_sm if available (injected earlier on private key), else bundle.lists_sm
-    import pandas as pd
-
-    scenario_sm_pairs: List[Tuple[str, str]] | None = None
-    if isinstance(raw_seeds, Mapping):
-        scenario_sm_pairs = raw_seeds.get("__scenario_lists_sm__")  # type: ignore[assignment]
-    if scenario_sm_pairs:
-        sm_df = pd.DataFrame(scenario_sm_pairs, columns=["Sector", "Material"]).drop_duplicates()
-    else:
-        sm_df = getattr(bundle, "lists_sm", None)
-        if sm_df is None or sm_df.empty:
-            raise ValueError("SM-mode requires non-empty lists_sm (provide via scenario or inputs.json)")
-        if not getattr(bundle, "lists_sm_explicit", False):
-            raise ValueError("SM-mode requires lists_sm be explicitly provided (scenario or inputs.json), not derived")
-    allowed_pairs = {(str(r["Sector"]), str(r["Material"])) for _, r in sm_df.iterrows()}
-    out: Dict[str, Dict[str, int]] = {}
+    # Use the shared SM universe when given, else scenario-provided lists_sm (private key) or bundle.lists_sm
+    if allowed_pairs is None:
+        allowed_pairs = _build_sm_allowed_pairs(bundle, raw_seeds.get("__scenario_lists_sm__"))  # type: ignore[arg-type]
+    pairs: List[Tuple[str, str]] = []
+    raw_values: List[object] = []
     for sector, mat_map in block.items():
         s = str(sector)
         if not isinstance(mat_map, Mapping):
@@ -458,15 +577,21 @@ def _validate_completed_projects_sm(
             m = str(material)
             if (s, m) not in allowed_pairs:
                 raise ValueError(f"seeds.completed_projects_sm contains unknown pair ('{s}', '{m}') not in lists_sm")
-            v_float = _coerce_numeric(raw_val, f"seeds.completed_projects_sm['{s}']['{m}']")
-            if v_float < 0 or int(v_float) != v_float:
-                raise ValueError(f"seeds.completed_projects_sm['{s}']['{m}'] must be a non-negative integer")
-            out.setdefault(s, {})[m] = int(v_float)
+            pairs.append((s, m))
+            raw_values.append(raw_val)
+    counts = _coerce_non_negative_ints(raw_values, [f"seeds.completed_projects_sm['{s}']['{m}']" for s, m in pairs])
+    out: Dict[str, Dict[str, int]] = {}
+    for (s, m), count in zip(pairs, counts):
+        out.setdefault(s, {})[m] = count
     return out
 
 
 def _validate_elapsed_quarters_sm(
-    raw_seeds: Optional[Mapping[str, object]], *, bundle: Phase1Bundle, anchor_mode: str
+    raw_seeds: Optional[Mapping[str, object]],
+    *,
+    bundle: Phase1Bundle,
+    anchor_mode: str,
+    allowed_pairs: Optional[frozenset[Tuple[str, str]]] = None,
 ) -> Dict[str, Dict[str, int]]:
     """Validate SM-mode elapsed quarters per (sector, material).
 
@@ -484,21 +609,11 @@ def _validate_elapsed_quarters_sm(
         return {}
     if not isinstance(block, Mapping):
         raise ValueError("seeds.elapsed_quarters_sm must be a mapping of sector -> mapping(material -> int)")
-    # Build SM universe
-    import pandas as pd
-
-    sm_df = getattr(bundle, "lists_sm", None)
-    if sm_df is None or sm_df.empty:
-        # Allow scenario-level lists_sm injected earlier for validation when present
-        scenario_sm_pairs: List[Tuple[str, str]] | None = raw_seeds.get("__scenario_lists_sm__")  # type: ignore[assignment]
-        if scenario_sm_pairs:
-            sm_df = pd.DataFrame(scenario_sm_pairs, columns=["Sector", "Material"]).drop_duplicates()
-        else:
-            raise ValueError(
-                "SM-mode requires non-empty lists_sm (provide via scenario or inputs.json) to validate elapsed_quarters_sm"
-            )
-    allowed_pairs = {(str(r["Sector"]), str(r["Material"])) for _, r in sm_df.iterrows()}
-    out: Dict[str, Dict[str, int]] = {}
+    # Use the shared SM universe when given, else scenario-provided lists_sm (private key) or bundle.lists_sm
+    if allowed_pairs is None:
+        allowed_pairs = _build_sm_allowed_pairs(bundle, raw_seeds.get("__scenario_lists_sm__"))  # type: ignore[arg-type]
+    pairs: List[Tuple[str, str]] = []
+    raw_values: List[object] = []
     for sector, mat_map in block.items():
         s = str(sector)
         if not isinstance(mat_map, Mapping):
@@ -507,10 +622,12 @@ def _validate_elapsed_quarters_sm(
             m = str(material)
             if (s, m) not in allowed_pairs:
                 raise ValueError(f"seeds.elapsed_quarters_sm contains unknown pair ('{s}', '{m}') not in lists_sm")
-            v_float = _coerce_numeric(raw_val, f"seeds.elapsed_quarters_sm['{s}']['{m}']")
-            if v_float < 0 or int(v_float) != v_float:
-                raise ValueError(f"seeds.elapsed_quarters_sm['{s}']['{m}'] must be a non-negative integer")
-            out.setdefault(s, {})[m] = int(v_float)
+            pairs.append((s, m))
+            raw_values.append(raw_val)
+    counts = _coerce_non_negative_ints(raw_values, [f"seeds.elapsed_quarters_sm['{s}']['{m}']" for s, m in pairs])
+    out: Dict[str, Dict[str, int]] = {}
+    for (s, m), count in zip(pairs, counts):
+        out.setdefault(s, {})[m] = count
     return out
 
 
@@ -530,17 +647,46 @@ def _validate_direct_seeds(raw_seeds: Optional[Mapping[str, object]], *, bundle:
         return {}
     if not isinstance(dc, Mapping):
         raise ValueError("'seeds.direct_clients' must be a mapping of product -> non-negative integer")
-    products_set = set(map(str, bundle.lists.products))
-    out: Dict[str, int] = {}
-    for product, raw_val in dc.items():
+    _, products_set = _bundle_name_sets(bundle)
+    keys: List[str] = []
+    for product in dc.keys():
         m = str(product)
         if m not in products_set:
             raise ValueError(f"seeds.direct_clients contains unknown product '{m}'")
-        v_float = _coerce_numeric(raw_val, f"seeds.direct_clients['{m}']")
-        if v_float < 0 or int(v_float) != v_float:
-            raise ValueError(f"seeds.direct_clients['{m}'] must be a non-negative integer")
-        out[m] = int(v_float)
-    return out
+        keys.append(m)
+    counts = _coerce_non_negative_ints(list(dc.values()), [f"seeds.direct_clients['{m}']" for m in keys])
+    return dict(zip(keys, counts))
+
+
+def _bundle_name_sets(bundle: Phase1Bundle) -> Tuple[frozenset[str], frozenset[str]]:
+    """Return (sectors, products) of `bundle.lists` as frozensets, cached on the bundle.
+
+    `ListsData.sectors`/`products` rebuild their lists from the DataFrame on
+    every access; validators only need membership tests. Names are interned so
+    the same vocabulary is shared by all cached sets.
+    """
+    cached = getattr(bundle, "_name_sets", None)
+    if cached is None:
+        cached = (
+            frozenset(intern(str(x).strip()) for x in bundle.lists.sectors),
+            frozenset(intern(str(x).strip()) for x in bundle.lists.products),
+        )
+        bundle._name_sets = cached  # type: ignore[attr-defined]
+    return cached
+
+
+def _cached_material_surfaces(bundle: Phase1Bundle) -> Tuple[frozenset[str], frozenset[str], frozenset[str]]:
+    """Return (other_params, production, pricing) product names for `bundle`.
+
+    The sets are computed once and cached on the bundle instance; bundles are
+    never mutated in place (overrides produce new bundles), so the cache cannot
+    go stale.
+    """
+    if getattr(bundle, "_other_cols_fs", None) is None:
+        bundle._other_cols_fs = frozenset(bundle.other.by_product.columns.astype(str))  # type: ignore[attr-defined]
+        bundle._prod_mats_fs = frozenset(bundle.production.long["Material"].unique())  # type: ignore[attr-defined]
+        bundle._price_mats_fs = frozenset(bundle.pricing.long["Material"].unique())  # type: ignore[attr-defined]
+    return bundle._other_cols_fs, bundle._prod_mats_fs, bundle._price_mats_fs  # type: ignore[attr-defined]
 
 
 def _validate_primary_map_override(raw_pm: object, *, bundle: Phase1Bundle) -> Dict[str, List[Tuple[str, float]]]:
@@ -564,11 +710,8 @@ def _validate_primary_map_override(raw_pm: object, *, bundle: Phase1Bundle) -> D
             "overrides.primary_map must be a mapping of sector -> list[ {product, start_year} ]"
         )
 
-    sectors_set = set(bundle.lists.sectors)
-    products_set = set(bundle.lists.products)
-    other_cols = set(bundle.other.by_product.columns.astype(str))
-    prod_products = set(bundle.production.long["Material"].unique())
-    price_products = set(bundle.pricing.long["Material"].unique())
+    sectors_set, products_set = _bundle_name_sets(bundle)
+    other_cols, prod_products, price_products = _cached_material_surfaces(bundle)
 
     out: Dict[str, List[Tuple[str, float]]] = {}
     for sector, entries in raw_pm.items():
@@ -613,14 +756,51 @@ def _validate_primary_map_override(raw_pm: object, *, bundle: Phase1Bundle) -> D
     return out
 
 
+def _validate_scenario_lists_sm(raw_lists_sm: Sequence[object], *, bundle: Phase1Bundle) -> List[Tuple[str, str]]:
+    """Validate scenario-level lists_sm entries and return unique (Sector, Material) pairs.
+
+    Names are stripped and checked against `bundle.lists` with vectorized
+    pandas ops; the first offending entry (by index) is reported. Duplicates
+    are dropped keeping first-occurrence order, without copying the frame.
+    """
+    for idx, entry in enumerate(raw_lists_sm):
+        if not isinstance(entry, Mapping):
+            raise ValueError(f"lists_sm[{idx}] must be a mapping with 'Sector' and 'Material'")
+    if not raw_lists_sm:
+        return []
+    df = pd.DataFrame(
+        [(e.get("Sector", ""), e.get("Material", "")) for e in raw_lists_sm],  # type: ignore[union-attr]
+        columns=["Sector", "Material"],
+    )
+    df["Sector"] = df["Sector"].astype(str).str.strip()
+    df["Material"] = df["Material"].astype(str).str.strip()
+    sectors_set, products_set = _bundle_name_sets(bundle)
+    missing = (df["Sector"] == "") | (df["Material"] == "")
+    unknown_s = ~df["Sector"].isin(sectors_set)
+    unknown_m = ~df["Material"].isin(products_set)
+    bad = np.flatnonzero((missing | unknown_s | unknown_m).to_numpy())
+    if bad.size:
+        idx = int(bad[0])
+        if missing.iat[idx]:
+            raise ValueError(f"lists_sm[{idx}] missing Sector or Material")
+        if unknown_s.iat[idx]:
+            raise ValueError(f"lists_sm[{idx}] references unknown sector '{df['Sector'].iat[idx]}'")
+        raise ValueError(f"lists_sm[{idx}] references unknown product '{df['Material'].iat[idx]}'")
+    return list(dict.fromkeys(zip(df["Sector"], df["Material"])))
+
+
 def _validate_overrides(
     overrides: Mapping[str, object],
-    permissible_constants: set,
-    permissible_points: set,
-) -> Tuple[Dict[str, float], Dict[str, List[Tuple[float, float]]]]:
+    permissible_constants: frozenset[str],
+    permissible_points: frozenset[str],
+) -> Tuple[Dict[str, float], Dict[str, Tuple[Tuple[float, float], ...]]]:
     """Validate overrides blocks and return normalized (constants, points)."""
-    constants_block = overrides.get("constants", {}) if overrides else {}
-    points_block = overrides.get("points", {}) if overrides else {}
+    if not overrides:
+        return {}, {}
+    if not isinstance(overrides, Mapping):
+        raise ValueError("overrides must be a mapping with optional 'constants', 'points' and 'primary_map' blocks")
+    constants_block = overrides.get("constants", {})
+    points_block = overrides.get("points", {})
 
     if not isinstance(constants_block, Mapping):
         raise ValueError("overrides.constants must be a mapping of name -> value")
@@ -628,7 +808,7 @@ def _validate_overrides(
         raise ValueError("overrides.points must be a mapping of lookup_name -> [[t,v], ...]")
 
     constants_out: Dict[str, float] = {}
-    points_out: Dict[str, List[Tuple[float, float]]] = {}
+    points_out: Dict[str, Tuple[Tuple[float, float], ...]] = {}
 
     # Validate constants
     unknown_constants: List[str] = []
@@ -702,32 +882,33 @@ def _validate_runspecs(raw_runspecs: Optional[Mapping[str, object]]) -> RunSpecs
     return RunSpecs(start, stop, dt, mode)
 
 
-def load_and_validate_scenario(path: Path, *, bundle: Phase1Bundle) -> Scenario:
-    """Load a scenario file and validate it against Phase 1 inputs.
+def _nz(value):
+    """Map empty optional Scenario fields to None (the single place defining empty-vs-None)."""
+    return value or None
 
-    Parameters
-    ----------
-    path : Path
-        Path to YAML or JSON scenario file
-    bundle : Phase1Bundle
-        Phase 1 inputs containing sectors, materials, and parameter names
 
-    Returns
-    -------
-    Scenario
-        Validated, normalized scenario data structure
+def _validate_scenario_core(
+    raw: Mapping[str, object],
+    bundle: Phase1Bundle,
+    *,
+    default_name: str,
+    base_keys: Optional[Mapping[str, Tuple[frozenset[str], frozenset[str]]]] = None,
+) -> Scenario:
+    """Validate a deserialized scenario mapping against Phase 1 inputs.
+
+    Shared by `load_and_validate_scenario` and `validate_scenario_dict`.
+    `default_name` is used when the scenario has no `name`; `base_keys`
+    optionally holds precomputed permissible keys per anchor mode (see
+    `build_scenario_validator`).
     """
-    # 1) Deserialize
-    raw = _load_raw_scenario(path)
-
-    # 2) Normalize name and runspecs with defaults
-    name = str(raw.get("name") or path.stem)
+    # 1) Normalize name and runspecs with defaults
+    name = str(raw.get("name") or default_name)
     runspecs = _validate_runspecs(raw.get("runspecs"))
 
-    # 3) Phase 13: optional primary_map overrides (validate early to expand permissible keys)
+    # 2) Phase 13: optional primary_map overrides (validate early to expand permissible keys)
     pm_overrides = {}
     overrides_block = raw.get("overrides", {}) or {}
-    if "primary_map" in overrides_block:
+    if isinstance(overrides_block, Mapping) and "primary_map" in overrides_block:
         pm_overrides = _validate_primary_map_override(overrides_block.get("primary_map"), bundle=bundle)
 
     # Build extra (sector, product) pairs from primary_map overrides to expand permissible constants surface
@@ -736,38 +917,24 @@ def load_and_validate_scenario(path: Path, *, bundle: Phase1Bundle) -> Scenario:
         for prod, _sy in entries:
             extra_pairs.append((sector, prod))
 
-    # 3a) Optional scenario-level lists_sm (SM universe). Validate against lists and store as tuples.
+    # 2a) Optional scenario-level lists_sm (SM universe). Validate against lists and store as tuples.
     scenario_lists_sm_pairs: List[Tuple[str, str]] = []
     raw_lists_sm = raw.get("lists_sm")
     if raw_lists_sm is not None:
         if not isinstance(raw_lists_sm, (list, tuple)):
             raise ValueError("lists_sm must be a list of mappings with keys 'Sector' and 'Material'")
-        sectors_set = set(map(str, bundle.lists.sectors))
-        products_set = set(map(str, bundle.lists.products))
-        seen: set[Tuple[str, str]] = set()
-        for idx, entry in enumerate(raw_lists_sm):
-            if not isinstance(entry, Mapping):
-                raise ValueError(f"lists_sm[{idx}] must be a mapping with 'Sector' and 'Material'")
-            s = str(entry.get("Sector", "")).strip()
-            m = str(entry.get("Material", "")).strip()
-            if not s or not m:
-                raise ValueError(f"lists_sm[{idx}] missing Sector or Material")
-            if s not in sectors_set:
-                raise ValueError(f"lists_sm[{idx}] references unknown sector '{s}'")
-            if m not in products_set:
-                raise ValueError(f"lists_sm[{idx}] references unknown product '{m}'")
-            pair = (s, m)
-            if pair not in seen:
-                seen.add(pair)
-                scenario_lists_sm_pairs.append(pair)
+        scenario_lists_sm_pairs = _validate_scenario_lists_sm(raw_lists_sm, bundle=bundle)
         # Expand permissible keys surface using scenario-provided SM universe
         extra_pairs.extend(scenario_lists_sm_pairs)
 
-    # 4) Build the whitelist of valid override keys from Phase 1 inputs + scenario primary_map pairs
-    permissible_constants, permissible_points = _collect_permissible_override_keys(
-        bundle, anchor_mode=runspecs.anchor_mode, extra_sm_pairs=extra_pairs or None
-    )
-    constants, points = _validate_overrides(raw.get("overrides", {}) or {}, permissible_constants, permissible_points)
+    # 3) Build the whitelist of valid override keys from Phase 1 inputs + scenario primary_map pairs
+    if base_keys is not None and not extra_pairs:
+        permissible_constants, permissible_points = base_keys[runspecs.anchor_mode]
+    else:
+        permissible_constants, permissible_points = _collect_permissible_override_keys(
+            bundle, anchor_mode=runspecs.anchor_mode, extra_sm_pairs=extra_pairs or None
+        )
+    constants, points = _validate_overrides(overrides_block, permissible_constants, permissible_points)
 
     # Phase 14: seeds (scenario-specific)
     seeds_block = raw.get("seeds")
@@ -778,10 +945,20 @@ def load_and_validate_scenario(path: Path, *, bundle: Phase1Bundle) -> Scenario:
         seeds_block["__scenario_lists_sm__"] = scenario_lists_sm_pairs  # type: ignore[index]
     seeds_active, seeds_elapsed = _validate_seeds(seeds_block, bundle=bundle)
     seeds_direct = _validate_direct_seeds(seeds_block, bundle=bundle)
-    seeds_sm = _validate_seeds_sm(seeds_block, bundle=bundle, anchor_mode=runspecs.anchor_mode)
+    # SM universe is built once and shared by all SM-mode seed validators and the coverage check
+    sm_allowed_pairs: Optional[frozenset[Tuple[str, str]]] = None
+    if runspecs.anchor_mode == "sm" and isinstance(seeds_block, Mapping) and _SM_SEED_BLOCKS.intersection(seeds_block):
+        sm_allowed_pairs = _build_sm_allowed_pairs(bundle, scenario_lists_sm_pairs)
+    seeds_sm = _validate_seeds_sm(
+        seeds_block, bundle=bundle, anchor_mode=runspecs.anchor_mode, allowed_pairs=sm_allowed_pairs
+    )
     seeds_completed = _validate_completed_projects(seeds_block, bundle=bundle, anchor_mode=runspecs.anchor_mode)
-    seeds_completed_sm = _validate_completed_projects_sm(seeds_block, bundle=bundle, anchor_mode=runspecs.anchor_mode)
-    seeds_elapsed_sm = _validate_elapsed_quarters_sm(seeds_block, bundle=bundle, anchor_mode=runspecs.anchor_mode)
+    seeds_completed_sm = _validate_completed_projects_sm(
+        seeds_block, bundle=bundle, anchor_mode=runspecs.anchor_mode, allowed_pairs=sm_allowed_pairs
+    )
+    seeds_elapsed_sm = _validate_elapsed_quarters_sm(
+        seeds_block, bundle=bundle, anchor_mode=runspecs.anchor_mode, allowed_pairs=sm_allowed_pairs
+    )
 
     # Phase 17.1/17.5: When in SM-mode, enforce strict rules
     if runspecs.anchor_mode == "sm":
@@ -789,78 +966,69 @@ def load_and_validate_scenario(path: Path, *, bundle: Phase1Bundle) -> Scenario:
         if seeds_active:
             raise ValueError("SM-mode prohibits seeds.active_anchor_clients; use seeds.active_anchor_clients_sm instead")
         # Validate lists_sm exists (scenario-level satisfies requirement); prefer scenario-provided pairs
-        import pandas as pd
-
-        if scenario_lists_sm_pairs:
-            sm_df = pd.DataFrame(scenario_lists_sm_pairs, columns=["Sector", "Material"]).drop_duplicates()
-        else:
-            sm_df = getattr(bundle, "lists_sm", None)
-            if sm_df is None or sm_df.empty:
-                raise ValueError("SM-mode requires non-empty lists_sm (provide via scenario or inputs.json)")
-            if not getattr(bundle, "lists_sm_explicit", False):
-                raise ValueError("SM-mode requires lists_sm be explicitly provided (scenario or inputs.json), not derived")
-        # Build coverage matrix for targeted params
-        targeted_sm_params = {
-            "anchor_start_year",
-            "anchor_client_activation_delay",
-            "anchor_lead_generation_rate",
-            "lead_to_pc_conversion_rate",
-            "project_generation_rate",
-            "max_projects_per_pc",
-            "project_duration",
-            "projects_to_client_conversion",
-            "initial_phase_duration",
-            "ramp_phase_duration",
-            "ATAM",
-            "initial_requirement_rate",
-            "initial_req_growth",
-            "ramp_requirement_rate",
-            "ramp_req_growth",
-            "steady_requirement_rate",
-            "steady_req_growth",
-            "requirement_to_order_lag",
-            "requirement_limit_multiplier",
-        }
+        if sm_allowed_pairs is None:
+            sm_allowed_pairs = _build_sm_allowed_pairs(bundle, scenario_lists_sm_pairs)
         anchor_sm_df = getattr(bundle, "anchor_sm", None)
         if anchor_sm_df is None or anchor_sm_df.empty:
             raise ValueError(
                 "SM-mode requires anchor_params_sm with full coverage for all targeted parameters and pairs in lists_sm"
             )
-        # Create a set of available triples
-        available = {
-            (str(r["Sector"]).strip(), str(r["Material"]).strip(), str(r["Param"]).strip()) for _, r in anchor_sm_df.iterrows()
-        }
-        # Also count scenario-provided per-(s,m) constants toward coverage
-        available |= _sm_constants_from_overrides(constants, bundle, targeted_sm_params)
-        missing: list[str] = []
-        for _, row in sm_df.iterrows():
-            s = str(row["Sector"]).strip()
-            m = str(row["Material"]).strip()
-            for p in targeted_sm_params:
-                if (s, m, p) not in available:
-                    missing.append(f"({s}, {m}, {p})")
-        if missing:
-            # Keep message concise but actionable; cap long lists
-            preview = ", ".join(missing[:10]) + (" ..." if len(missing) > 10 else "")
-            raise ValueError("SM-mode missing per-(sector, material) parameters for: " + preview)
-
+        # Coverage only needs computing when there is at least one pair to check
+        if sm_allowed_pairs:
+            # Available triples from inputs.json; scenario-provided per-(s,m) constants also count toward coverage.
+            # The cached bundle set is used as-is unless the scenario adds triples, avoiding a per-call copy.
+            available = _anchor_sm_triples(bundle)
+            override_triples = _sm_constants_from_overrides(constants, sm_allowed_pairs, _TARGETED_SM_PARAMS)
+            if override_triples:
+                available = available | override_triples
+            missing = _missing_sm_triples(sm_allowed_pairs, available, _TARGETED_SM_PARAMS)
+            if len(missing):
+                # Keep message concise but actionable; cap long lists (only the preview is formatted)
+                preview_items = list(islice(missing, _MISSING_PREVIEW_LIMIT + 1))
+                preview = ", ".join(f"({s}, {m}, {p})" for s, m, p in preview_items[:_MISSING_PREVIEW_LIMIT])
+                if len(preview_items) > _MISSING_PREVIEW_LIMIT:
+                    preview += " ..."
+                raise ValueError("SM-mode missing per-(sector, material) parameters for: " + preview)
+
+    seed_kwargs = {
+        "seeds_active_anchor_clients": _nz(seeds_active),
+        "seeds_elapsed_quarters": _nz(seeds_elapsed),
+        "seeds_direct_clients": _nz(seeds_direct),
+        "seeds_active_anchor_clients_sm": _nz(seeds_sm),
+        "seeds_elapsed_quarters_sm": _nz(seeds_elapsed_sm),
+        "seeds_completed_projects": _nz(seeds_completed),
+        "seeds_completed_projects_sm": _nz(seeds_completed_sm),
+    }
     return Scenario(
         name=name,
         runspecs=runspecs,
-        constants=constants,
-        points=points,
-        primary_map=pm_overrides or None,
-        lists_sm=scenario_lists_sm_pairs or None,
-        seeds_active_anchor_clients=seeds_active or None,
-        seeds_elapsed_quarters=seeds_elapsed or None,
-        seeds_direct_clients=seeds_direct or None,
-        seeds_active_anchor_clients_sm=seeds_sm or None,
-        seeds_elapsed_quarters_sm=seeds_elapsed_sm or None,
-        seeds_completed_projects=seeds_completed or None,
-        seeds_completed_projects_sm=seeds_completed_sm or None,
+        constants=MappingProxyType(constants),
+        points=MappingProxyType(points),
+        primary_map=_nz(pm_overrides),
+        lists_sm=_nz(scenario_lists_sm_pairs),
+        **seed_kwargs,
     )
 
 
+def load_and_validate_scenario(path: Path, *, bundle: Phase1Bundle) -> Scenario:
+    """Load a scenario file and validate it against Phase 1 inputs.
+
+    Parameters
+    ----------
+    path : Path
+        Path to YAML or JSON scenario file
+    bundle : Phase1Bundle
+        Phase 1 inputs containing sectors, materials, and parameter names
+
+    Returns
+    -------
+    Scenario
+        Validated, normalized scenario data structure
+    """
+    raw = _load_raw_scenario(path)
+    return _validate_scenario_core(raw, bundle, default_name=path.stem)
+
+
 def list_permissible_override_keys(
     bundle: Phase1Bundle,
     *,
@@ -873,7 +1041,7 @@ def list_permissible_override_keys(
     can query valid element names without importing private helpers.
 
     Returns a dictionary:
-      { "constants": set[str], "points": set[str] }
+      { "constants": frozenset[str], "points": frozenset[str] }
     """
     constants, points = _collect_permissible_override_keys(bundle, anchor_mode=anchor_mode, extra_sm_pairs=extra_sm_pairs)
     return {"constants": constants, "points": points}
@@ -888,137 +1056,27 @@ def validate_scenario_dict(bundle: Phase1Bundle, scenario_dict: Mapping[str, obj
     """
     if not isinstance(scenario_dict, Mapping):
         raise ValueError("scenario_dict must be a mapping/dict at the root")
+    return _validate_scenario_core(scenario_dict, bundle, default_name="untitled")
 
-    # Name and runspecs
-    name = str(scenario_dict.get("name") or "untitled")
-    runspecs = _validate_runspecs(scenario_dict.get("runspecs"))
-
-    # Primary map overrides (optional) — validate early to expand permissible keys
-    pm_overrides = {}
-    overrides_block = scenario_dict.get("overrides", {}) or {}
-    if isinstance(overrides_block, Mapping) and "primary_map" in overrides_block:
-        pm_overrides = _validate_primary_map_override(overrides_block.get("primary_map"), bundle=bundle)
-
-    # Extra (sector, product) pairs from primary_map to expand constants surface
-    extra_pairs: List[Tuple[str, str]] = []
-    for sector, entries in (pm_overrides or {}).items():
-        for prod, _sy in entries:
-            extra_pairs.append((sector, prod))
-
-    # Optional scenario-level lists_sm
-    scenario_lists_sm_pairs: List[Tuple[str, str]] = []
-    raw_lists_sm = scenario_dict.get("lists_sm")
-    if raw_lists_sm is not None:
-        if not isinstance(raw_lists_sm, (list, tuple)):
-            raise ValueError("lists_sm must be a list of mappings with keys 'Sector' and 'Material'")
-        sectors_set = set(map(str, bundle.lists.sectors))
-        products_set = set(map(str, bundle.lists.products))
-        seen: set[Tuple[str, str]] = set()
-        for idx, entry in enumerate(raw_lists_sm):
-            if not isinstance(entry, Mapping):
-                raise ValueError(f"lists_sm[{idx}] must be a mapping with 'Sector' and 'Material'")
-            s = str(entry.get("Sector", "")).strip()
-            m = str(entry.get("Material", "")).strip()
-            if not s or not m:
-                raise ValueError(f"lists_sm[{idx}] missing Sector or Material")
-            if s not in sectors_set:
-                raise ValueError(f"lists_sm[{idx}] references unknown sector '{s}'")
-            if m not in products_set:
-                raise ValueError(f"lists_sm[{idx}] references unknown product '{m}'")
-            pair = (s, m)
-            if pair not in seen:
-                seen.add(pair)
-                scenario_lists_sm_pairs.append(pair)
-        extra_pairs.extend(scenario_lists_sm_pairs)
 
-    # Permissible keys then overrides normalization
-    permissible_constants, permissible_points = _collect_permissible_override_keys(
-        bundle, anchor_mode=runspecs.anchor_mode, extra_sm_pairs=extra_pairs or None
-    )
-    constants, points = _validate_overrides(overrides_block, permissible_constants, permissible_points)
+def build_scenario_validator(bundle: Phase1Bundle) -> Callable[[Mapping[str, object]], Scenario]:
+    """Return a `validate_scenario_dict` equivalent specialized to one bundle.
 
-    # Seeds (Phase 14 and SM-mode Phase 17.1)
-    seeds_block = scenario_dict.get("seeds")
-    if isinstance(seeds_block, dict) and scenario_lists_sm_pairs:
-        seeds_block = dict(seeds_block)
-        seeds_block["__scenario_lists_sm__"] = scenario_lists_sm_pairs  # type: ignore[index]
-    seeds_active, seeds_elapsed = _validate_seeds(seeds_block, bundle=bundle)
-    seeds_direct = _validate_direct_seeds(seeds_block, bundle=bundle)
-    seeds_sm = _validate_seeds_sm(seeds_block, bundle=bundle, anchor_mode=runspecs.anchor_mode)
-    seeds_elapsed_sm = _validate_elapsed_quarters_sm(seeds_block, bundle=bundle, anchor_mode=runspecs.anchor_mode)
-    seeds_completed = _validate_completed_projects(scenario_dict.get("seeds"), bundle=bundle, anchor_mode=runspecs.anchor_mode)
-    seeds_completed_sm = _validate_completed_projects_sm(
-        scenario_dict.get("seeds"), bundle=bundle, anchor_mode=runspecs.anchor_mode
-    )
+    Intended for batch sweeps that validate many scenarios against the same
+    Phase 1 inputs: the bundle-derived permissible key sets (for both anchor
+    modes) and primary_map product surfaces are computed once here instead of
+    once per scenario. Scenarios that widen the key surface via primary_map or
+    lists_sm still get their keys computed per call.
+    """
+    _cached_material_surfaces(bundle)
+    base_keys = {mode: _collect_permissible_override_keys(bundle, anchor_mode=mode) for mode in ("sector", "sm")}
 
-    # SM-mode strictness
-    if runspecs.anchor_mode == "sm":
-        import pandas as pd
+    def _validate(scenario_dict: Mapping[str, object]) -> Scenario:
+        if not isinstance(scenario_dict, Mapping):
+            raise ValueError("scenario_dict must be a mapping/dict at the root")
+        return _validate_scenario_core(scenario_dict, bundle, default_name="untitled", base_keys=base_keys)
 
-        if scenario_lists_sm_pairs:
-            sm_df = pd.DataFrame(scenario_lists_sm_pairs, columns=["Sector", "Material"]).drop_duplicates()
-        else:
-            sm_df = getattr(bundle, "lists_sm", None)
-            if sm_df is None or sm_df.empty:
-                raise ValueError("SM-mode requires non-empty lists_sm (provide via scenario or inputs.json)")
-            if not getattr(bundle, "lists_sm_explicit", False):
-                raise ValueError("SM-mode requires lists_sm be explicitly provided (scenario or inputs.json), not derived")
-        targeted_sm_params = {
-            "anchor_start_year",
-            "anchor_client_activation_delay",
-            "anchor_lead_generation_rate",
-            "lead_to_pc_conversion_rate",
-            "project_generation_rate",
-            "max_projects_per_pc",
-            "project_duration",
-            "projects_to_client_conversion",
-            "initial_phase_duration",
-            "ramp_phase_duration",
-            "ATAM",
-            "initial_requirement_rate",
-            "initial_req_growth",
-            "ramp_requirement_rate",
-            "ramp_req_growth",
-            "steady_requirement_rate",
-            "steady_req_growth",
-            "requirement_to_order_lag",
-            "requirement_limit_multiplier",
-        }
-        anchor_sm_df = getattr(bundle, "anchor_sm", None)
-        if anchor_sm_df is None or anchor_sm_df.empty:
-            raise ValueError(
-                "SM-mode requires anchor_params_sm with full coverage for all targeted parameters and pairs in lists_sm"
-            )
-        available = {
-            (str(r["Sector"]).strip(), str(r["Material"]).strip(), str(r["Param"]).strip()) for _, r in anchor_sm_df.iterrows()
-        }
-        available |= _sm_constants_from_overrides(constants, bundle, targeted_sm_params)
-        missing: list[str] = []
-        for _, row in sm_df.iterrows():
-            s = str(row["Sector"]).strip()
-            m = str(row["Material"]).strip()
-            for p in targeted_sm_params:
-                if (s, m, p) not in available:
-                    missing.append(f"({s}, {m}, {p})")
-        if missing:
-            preview = ", ".join(missing[:10]) + (" ..." if len(missing) > 10 else "")
-            raise ValueError("SM-mode missing per-(sector, material) parameters for: " + preview)
-
-    return Scenario(
-        name=name,
-        runspecs=runspecs,
-        constants=constants,
-        points=points,
-        primary_map=pm_overrides or None,
-        lists_sm=scenario_lists_sm_pairs or None,
-        seeds_active_anchor_clients=seeds_active or None,
-        seeds_elapsed_quarters=seeds_elapsed or None,
-        seeds_direct_clients=seeds_direct or None,
-        seeds_active_anchor_clients_sm=seeds_sm or None,
-        seeds_elapsed_quarters_sm=seeds_elapsed_sm or None,
-        seeds_completed_projects=seeds_completed or None,
-        seeds_completed_projects_sm=seeds_completed_sm or None,
-    )
+    return _validate
 
 
 def summarize_lists(bundle: Phase1Bundle) -> dict:
@@ -1049,10 +1107,15 @@ __all__ = [
     "load_and_validate_scenario",
     "list_permissible_override_keys",
     "validate_scenario_dict",
+    "build_scenario_validator",
     "summarize_lists",
 ]
 
 
+# Lookup-name prefix -> converter-name builder for overrides.points keys
+_POINT_PREFIX_HANDLERS = (("price_", _price_conv_name), ("max_capacity_", _cap_conv_name))
+
+
 def validate_overrides_against_model(model, scenario: Scenario) -> None:
     """Phase 11 tightening: ensure every override key maps to an existing model element.
 
@@ -1068,13 +1131,11 @@ def validate_overrides_against_model(model, scenario: Scenario) -> None:
 
     # Check points by mapping lookup name -> converter name
     missing_points: list[str] = []
-    for lookup_name in scenario.points.keys():
-        if lookup_name.startswith("price_"):
-            material = lookup_name[len("price_"):].replace("_", " ")
-            conv_name = _price_conv_name(material)
-        elif lookup_name.startswith("max_capacity_"):
-            material = lookup_name[len("max_capacity_"):].replace("_", " ")
-            conv_name = _cap_conv_name(material)
+    for lookup_name in scenario.points:
+        for prefix, conv_name_fn in _POINT_PREFIX_HANDLERS:
+            if lookup_name.startswith(prefix):
+                conv_name = conv_name_fn(lookup_name.removeprefix(prefix).replace("_", " "))
+                break
         else:
             # Unknown pattern – fail fast with hint
             missing_points.append(f"{lookup_name} (unknown lookup prefix; expected 'price_' or 'max_capacity_')")
@@ -9,18 +9,213 @@ This module handles all data-related operations including:
 """
 
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any, Set
+from typing import Any, Callable, Dict, FrozenSet, Iterator, List, Optional, Tuple
 import logging
 import json
+from collections.abc import Mapping
+from sys import intern
+from itertools import chain, product as product_pairs
+
+try:  # Optional faster parser; the stdlib json module remains the reference
+    import orjson
+except ImportError:  # pragma: no cover - exercised only when orjson is absent
+    orjson = None
 
 from .state_manager import StateManager
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on cached (anchor_mode, extra_sm_pairs) permissible-key results
+_PERMISSIBLE_KEYS_CACHE_SIZE = 32
+
+# Parameter name prefixes for permissible constant keys; the sector/product
+# tail (e.g. "_Defense" or "_Defense_Product1") is appended per combination.
+_REQUIREMENT_PARAM_PREFIXES = (
+    "initial_requirement_rate",
+    "initial_req_growth",
+    "ramp_requirement_rate",
+    "ramp_req_growth",
+    "steady_requirement_rate",
+    "steady_req_growth",
+    "requirement_to_order_lag",
+)
+
+_ANCHOR_PARAM_PREFIXES = (
+    "anchor_start_year",
+    "anchor_client_activation_delay",
+    "anchor_lead_generation_rate",
+    "lead_to_pc_conversion_rate",
+    "project_generation_rate",
+    "max_projects_per_pc",
+    "project_duration",
+    "projects_to_client_conversion",
+    "initial_phase_duration",
+    "ramp_phase_duration",
+    *_REQUIREMENT_PARAM_PREFIXES,
+    "ATAM",
+)
+
+_POINT_PARAM_PREFIXES = ("price", "max_capacity")
+
+_OTHER_PARAM_PREFIXES = (
+    "lead_start_year",
+    "inbound_lead_generation_rate",
+    "outbound_lead_generation_rate",
+    "lead_to_c_conversion_rate",
+    "lead_to_requirement_delay",
+    "requirement_to_fulfilment_delay",
+    "avg_order_quantity_initial",
+    "client_requirement_growth",
+    "TAM",
+)
+
+
+def _parse_json_bytes(raw: bytes) -> Any:
+    """Parse JSON from raw bytes, using orjson when available.
+
+    Documents orjson rejects (e.g. NaN/Infinity literals) are re-parsed with
+    the stdlib so accepted inputs and error messages match ``json.loads``.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
+
+
+def _list_names(lists_data: Any, list_name: str) -> Tuple[Any, ...]:
+    """Return a named list from the 'lists' section as a tuple of interned names.
+
+    Malformed sections yield an empty tuple; ``_validate_data_bundle`` reports them.
+    """
+    names = lists_data.get(list_name) if isinstance(lists_data, dict) else None
+    if not isinstance(names, list):
+        return ()
+    return tuple(intern(n) if type(n) is str else n for n in names)
+
+
+def _product_key_sets(bundle: "DataBundle") -> Tuple[FrozenSet[str], FrozenSet[str]]:
+    """Return (point keys, other-client constant keys) for the bundle's products.
+
+    Both depend only on the product list, so they are built once and cached on
+    the bundle instance; bundles are replaced, never mutated, on reload.
+    """
+    cached = getattr(bundle, '_product_keys', None)
+    if cached is None:
+        tails = [f"_{product}" for product in bundle.products]
+        cached = (
+            frozenset(p + tail for tail in tails for p in _POINT_PARAM_PREFIXES),
+            frozenset(p + tail for tail in tails for p in _OTHER_PARAM_PREFIXES),
+        )
+        bundle._product_keys = cached
+    return cached
+
+
+def _base_constant_keys(bundle: "DataBundle", anchor_mode: str) -> FrozenSet[str]:
+    """Return the constant keys for the bundle's own sectors/products in a mode.
+
+    Cached per anchor mode on the bundle instance so every permissible-keys
+    variant (e.g. SM mode with different extra pairs) shares the same base set.
+    """
+    cache = getattr(bundle, '_constant_keys', None)
+    if cache is None:
+        cache = bundle._constant_keys = {}
+    keys = cache.get(anchor_mode)
+    if keys is not None:
+        return keys
+    
+    # Keys are collected into one list and hashed by a single union (no incremental rehash-grows)
+    sp_tails = [head + product for head in (f"_{sector}_" for sector in bundle.sectors) for product in bundle.products]
+    if anchor_mode == "sector":
+        # Sector-level parameters, then per-(sector, product) requirement parameters
+        constants = [p + tail for tail in (f"_{sector}" for sector in bundle.sectors) for p in _ANCHOR_PARAM_PREFIXES]
+        constants += [p + tail for tail in sp_tails for p in _REQUIREMENT_PARAM_PREFIXES]
+    elif anchor_mode == "sm":
+        # SM-mode: full per-(sector, product) parameters
+        constants = [p + tail for tail in sp_tails for p in _ANCHOR_PARAM_PREFIXES]
+    else:
+        constants = []
+    
+    # Other client parameters depend only on the products
+    keys = cache[anchor_mode] = _product_key_sets(bundle)[1].union(constants)
+    return keys
+
+
+class _InvertedParamView(Mapping):
+    """Read-only {param: {entity: value}} view over {entity: {param: value}}.
+    
+    Each parameter's column is built on first access and memoized; iterating
+    the view only collects parameter names. The source must not be mutated
+    while the view is in use (bundles are replaced, not mutated, on reload).
+    """
+    
+    __slots__ = ("_source", "_columns", "_names")
+    
+    def __init__(self, source: Dict[str, Dict[str, Any]]):
+        self._source = source
+        self._columns: Dict[str, Dict[str, Any]] = {}
+        self._names: Optional[Tuple[str, ...]] = None
+    
+    def __getitem__(self, param_name: str) -> Dict[str, Any]:
+        column = self._columns.get(param_name)
+        if column is None:
+            column = {entity: params[param_name] for entity, params in self._source.items() if param_name in params}
+            if not column:
+                raise KeyError(param_name)
+            self._columns[param_name] = column
+        return column
+    
+    def _param_names(self) -> Tuple[str, ...]:
+        if self._names is None:
+            self._names = tuple(dict.fromkeys(chain.from_iterable(self._source.values())))
+        return self._names
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._param_names())
+    
+    def __len__(self) -> int:
+        return len(self._param_names())
+
+
+def _build_sm_params(bundle: "DataBundle") -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """Copy SM-mode parameters as {param: {sector: {product: value}}}."""
+    anchor_params_sm = bundle.anchor_params_sm
+    if not anchor_params_sm:
+        return {}
+    return {
+        param_name: {sector: dict(product_data) for sector, product_data in sector_data.items()}
+        for param_name, sector_data in anchor_params_sm.items()
+    }
+
+
+def _sorted_year_series(data: Any) -> Tuple[Tuple[float, float], ...]:
+    """Convert a {year: value} mapping into (year, value) pairs sorted by year.
+
+    Entries whose year or value is not numeric are skipped.
+    """
+    if not isinstance(data, dict):
+        return ()
+    data_points = []
+    for year_str, value in data.items():
+        try:
+            data_points.append((float(year_str), float(value)))
+        except (ValueError, TypeError):
+            continue
+    data_points.sort(key=lambda x: x[0])
+    return tuple(data_points)
+
 
 class DataBundle:
     """Represents a bundle of data loaded from inputs.json."""
     
+    # The underscore slots hold lazily built key sets (see _product_key_sets/_base_constant_keys)
+    __slots__ = (
+        "lists", "anchor_params", "other_params", "production", "pricing", "primary_map",
+        "markets", "sectors", "products", "primary_map_parsed", "anchor_params_sm",
+        "_product_keys", "_constant_keys",
+    )
+    
     def __init__(self, lists: Dict, anchor_params: Dict, other_params: Dict, 
                  production: Dict, pricing: Dict, primary_map: Dict):
         """Initialize a data bundle.
@@ -34,11 +229,20 @@ class DataBundle:
             primary_map: Primary mapping data
         """
         self.lists = lists
+        # Flattened views of lists['lists'] for hot accessors
+        inner = lists.get('lists') if isinstance(lists, dict) else None
+        self.markets = _list_names(inner, 'markets')
+        self.sectors = _list_names(inner, 'sectors')
+        self.products = _list_names(inner, 'products')
         self.anchor_params = anchor_params
         self.other_params = other_params
         self.production = production
         self.pricing = pricing
         self.primary_map = primary_map
+        # {sector: [(product, start_year), ...]} with float start years; set by validation
+        self.primary_map_parsed: Optional[Dict[str, List[Tuple[str, float]]]] = None
+        # Optional SM-mode anchor parameters as {param: {sector: {product: value}}}
+        self.anchor_params_sm: Optional[Dict[str, Dict[str, Dict[str, Any]]]] = None
     
     def to_dict(self) -> Dict:
         """Convert to dictionary representation."""
@@ -55,8 +259,10 @@ class DataBundle:
 class PermissibleKeys:
     """Represents permissible keys for different sections."""
     
-    def __init__(self, constants: Set[str], points: Set[str], 
-                 sectors: Set[str], products: Set[str]):
+    __slots__ = ("constants", "points", "sectors", "products")
+    
+    def __init__(self, constants: FrozenSet[str], points: FrozenSet[str], 
+                 sectors: FrozenSet[str], products: FrozenSet[str]):
         """Initialize permissible keys.
         
         Args:
@@ -101,13 +307,38 @@ class DataManager:
         self.state_manager = state_manager
         self.project_root = Path(project_root)
         self._data_bundle: Optional[DataBundle] = None
-        self._permissible_keys_cache: Dict[str, PermissibleKeys] = {}
-        self._last_anchor_mode: Optional[str] = None
-        self._last_extra_pairs: Optional[List[Tuple[str, str]]] = None
+        self._permissible_keys_cache: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], PermissibleKeys] = {}
+        # Derived views of the current bundle (inverted params, sorted series)
+        self._view_cache: Dict[Tuple[str, ...], Any] = {}
+        # Last load failure and the inputs.json mtime it was observed at (negative cache)
+        self._load_error: Optional[str] = None
+        self._load_error_mtime_ns: Optional[int] = None
         
     def load_data_bundle(self) -> Tuple[bool, Optional[str], Optional[DataBundle]]:
         """Load the data bundle from inputs.json.
         
+        A failure is remembered together with the file's mtime so that
+        get_data_bundle does not re-parse an unchanged broken file.
+        
+        Returns:
+            Tuple of (success, error_message, data_bundle)
+        """
+        mtime_ns = self._inputs_mtime_ns()
+        success, error, bundle = self._read_data_bundle()
+        self._load_error = None if success else error
+        self._load_error_mtime_ns = None if success else mtime_ns
+        return success, error, bundle
+    
+    def _inputs_mtime_ns(self) -> Optional[int]:
+        """Return the mtime of inputs.json in nanoseconds, or None if it is missing."""
+        try:
+            return (self.project_root / "inputs.json").stat().st_mtime_ns
+        except OSError:
+            return None
+    
+    def _read_data_bundle(self) -> Tuple[bool, Optional[str], Optional[DataBundle]]:
+        """Parse and validate inputs.json, installing the bundle on success.
+        
         Returns:
             Tuple of (success, error_message, data_bundle)
         """
@@ -116,8 +347,7 @@ class DataManager:
             if not inputs_file.exists():
                 return False, "inputs.json not found", None
             
-            with open(inputs_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = _parse_json_bytes(inputs_file.read_bytes())
             
             # Validate required sections
             required_sections = ['lists', 'anchor_params', 'other_params', 'production', 'pricing', 'primary_map']
@@ -141,6 +371,7 @@ class DataManager:
                 return False, error, None
             
             self._data_bundle = bundle
+            self._view_cache.clear()
             logger.info("Data bundle loaded successfully")
             return True, None, bundle
             
@@ -160,6 +391,9 @@ class DataManager:
             Current data bundle or None if not loaded
         """
         if self._data_bundle is None:
+            if self._load_error is not None and self._load_error_mtime_ns == self._inputs_mtime_ns():
+                # Same file that already failed to load; don't re-parse it
+                return None
             success, error, bundle = self.load_data_bundle()
             if not success:
                 logger.error(f"Failed to load data bundle: {error}")
@@ -177,158 +411,75 @@ class DataManager:
         Returns:
             PermissibleKeys object
         """
-        # Check cache
-        cache_key = f"{anchor_mode}_{hash(str(extra_sm_pairs))}"
-        if (cache_key in self._permissible_keys_cache and 
-            self._last_anchor_mode == anchor_mode and 
-            self._last_extra_pairs == extra_sm_pairs):
-            return self._permissible_keys_cache[cache_key]
+        # Check cache (keyed on the actual arguments; hits move to the most-recent end)
+        cache_key = (anchor_mode, tuple(tuple(pair) for pair in extra_sm_pairs or ()))
+        cached = self._permissible_keys_cache.pop(cache_key, None)
+        if cached is not None:
+            self._permissible_keys_cache[cache_key] = cached
+            return cached
         
         # Get data bundle
         bundle = self.get_data_bundle()
         if bundle is None:
             # Return empty keys if bundle not available
-            return PermissibleKeys(set(), set(), set(), set())
+            return PermissibleKeys(frozenset(), frozenset(), frozenset(), frozenset())
         
         # Generate permissible keys
         constants = self._generate_constant_keys(bundle, anchor_mode, extra_sm_pairs)
         points = self._generate_point_keys(bundle)
-        sectors = set(bundle.lists.get('lists', {}).get('sectors', []))
-        products = set(bundle.lists.get('lists', {}).get('products', []))
+        sectors = frozenset(bundle.sectors)
+        products = frozenset(bundle.products)
         
         # Create permissible keys object
         permissible_keys = PermissibleKeys(constants, points, sectors, products)
         
-        # Cache the result
+        # Cache the result, evicting the least recently used entry when full
+        if len(self._permissible_keys_cache) >= _PERMISSIBLE_KEYS_CACHE_SIZE:
+            del self._permissible_keys_cache[next(iter(self._permissible_keys_cache))]
         self._permissible_keys_cache[cache_key] = permissible_keys
-        self._last_anchor_mode = anchor_mode
-        self._last_extra_pairs = extra_sm_pairs
         
         return permissible_keys
     
     def _generate_constant_keys(self, bundle: DataBundle, anchor_mode: str, 
-                              extra_sm_pairs: Optional[List[Tuple[str, str]]]) -> Set[str]:
+                              extra_sm_pairs: Optional[List[Tuple[str, str]]]) -> FrozenSet[str]:
         """Generate permissible constant keys.
         
         Args:
             bundle: Data bundle
             anchor_mode: Anchor mode
-            extra_sm_pairs: Extra (sector, product) pairs
+            extra_sm_pairs: Extra (sector, product) pairs (SM mode only)
             
         Returns:
-            Set of permissible constant keys
+            Frozenset of permissible constant keys
         """
-        constants = set()
-        
-        # Get sectors and products from the lists structure
-        sectors = bundle.lists.get('lists', {}).get('sectors', [])
-        products = bundle.lists.get('lists', {}).get('products', [])
-        
-        # Add anchor client parameters
-        if anchor_mode == "sector":
-            # Sector-level parameters
-            for sector in sectors:
-                constants.update([
-                    f"anchor_start_year_{sector}",
-                    f"anchor_client_activation_delay_{sector}",
-                    f"anchor_lead_generation_rate_{sector}",
-                    f"lead_to_pc_conversion_rate_{sector}",
-                    f"project_generation_rate_{sector}",
-                    f"max_projects_per_pc_{sector}",
-                    f"project_duration_{sector}",
-                    f"projects_to_client_conversion_{sector}",
-                    f"initial_phase_duration_{sector}",
-                    f"ramp_phase_duration_{sector}",
-                    f"initial_requirement_rate_{sector}",
-                    f"initial_req_growth_{sector}",
-                    f"ramp_requirement_rate_{sector}",
-                    f"ramp_req_growth_{sector}",
-                    f"steady_requirement_rate_{sector}",
-                    f"steady_req_growth_{sector}",
-                    f"requirement_to_order_lag_{sector}",
-                    f"ATAM_{sector}"
-                ])
-                
-                # Per-(sector, product) requirement parameters
-                for product in products:
-                    constants.update([
-                        f"initial_requirement_rate_{sector}_{product}",
-                        f"initial_req_growth_{sector}_{product}",
-                        f"ramp_requirement_rate_{sector}_{product}",
-                        f"ramp_req_growth_{sector}_{product}",
-                        f"steady_requirement_rate_{sector}_{product}",
-                        f"steady_req_growth_{sector}_{product}",
-                        f"requirement_to_order_lag_{sector}_{product}"
-                    ])
-        
-        elif anchor_mode == "sm":
-            # SM-mode: full per-(sector, product) parameters
-            # Add extra pairs if provided
-            if extra_sm_pairs:
-                for sector, product in extra_sm_pairs:
-                    if sector not in sectors:
-                        sectors.append(sector)
-                    if product not in products:
-                        products.append(product)
-            
-            for sector in sectors:
-                for product in products:
-                    constants.update([
-                        f"anchor_start_year_{sector}_{product}",
-                        f"anchor_client_activation_delay_{sector}_{product}",
-                        f"anchor_lead_generation_rate_{sector}_{product}",
-                        f"lead_to_pc_conversion_rate_{sector}_{product}",
-                        f"project_generation_rate_{sector}_{product}",
-                        f"max_projects_per_pc_{sector}_{product}",
-                        f"project_duration_{sector}_{product}",
-                        f"projects_to_client_conversion_{sector}_{product}",
-                        f"initial_phase_duration_{sector}_{product}",
-                        f"ramp_phase_duration_{sector}_{product}",
-                        f"initial_requirement_rate_{sector}_{product}",
-                        f"initial_req_growth_{sector}_{product}",
-                        f"ramp_requirement_rate_{sector}_{product}",
-                        f"ramp_req_growth_{sector}_{product}",
-                        f"steady_requirement_rate_{sector}_{product}",
-                        f"steady_req_growth_{sector}_{product}",
-                        f"requirement_to_order_lag_{sector}_{product}",
-                        f"ATAM_{sector}_{product}"
-                    ])
-        
-        # Add other client parameters
-        for product in products:
-            constants.update([
-                f"lead_start_year_{product}",
-                f"inbound_lead_generation_rate_{product}",
-                f"outbound_lead_generation_rate_{product}",
-                f"lead_to_c_conversion_rate_{product}",
-                f"lead_to_requirement_delay_{product}",
-                f"requirement_to_fulfilment_delay_{product}",
-                f"avg_order_quantity_initial_{product}",
-                f"client_requirement_growth_{product}",
-                f"TAM_{product}"
-            ])
-        
-        return constants
-    
-    def _generate_point_keys(self, bundle: DataBundle) -> Set[str]:
+        base = _base_constant_keys(bundle, anchor_mode)
+        if anchor_mode != "sm" or not extra_sm_pairs:
+            return base
+        
+        # SM-mode extras: only combinations involving a new sector or product add keys
+        sectors, products = bundle.sectors, bundle.products
+        known_sectors, known_products = set(sectors), set(products)
+        new_sectors = [s for s in dict.fromkeys(s for s, _ in extra_sm_pairs) if s not in known_sectors]
+        new_products = [p for p in dict.fromkeys(p for _, p in extra_sm_pairs) if p not in known_products]
+        if not new_sectors and not new_products:
+            return base
+        
+        new_pairs = chain(product_pairs(new_sectors, [*products, *new_products]), product_pairs(sectors, new_products))
+        extra = [p + tail for tail in (f"_{sector}_{product}" for sector, product in new_pairs)
+                 for p in _ANCHOR_PARAM_PREFIXES]
+        extra += [p + tail for tail in (f"_{product}" for product in new_products) for p in _OTHER_PARAM_PREFIXES]
+        return base.union(extra)
+    
+    def _generate_point_keys(self, bundle: DataBundle) -> FrozenSet[str]:
         """Generate permissible point keys.
         
         Args:
             bundle: Data bundle
             
         Returns:
-            Set of permissible point keys
+            Set of permissible point keys (price and capacity per product)
         """
-        points = set()
-        
-        # Add price and capacity keys for each product
-        for product in bundle.lists.get('lists', {}).get('products', []):
-            points.update([
-                f"price_{product}",
-                f"max_capacity_{product}"
-            ])
-        
-        return points
+        return _product_key_sets(bundle)[0]
     
     def _validate_data_bundle(self, bundle: DataBundle) -> Tuple[bool, Optional[str]]:
         """Validate a data bundle.
@@ -382,31 +533,25 @@ class DataManager:
             if not isinstance(bundle.primary_map, dict):
                 return False, "primary_map must be a dictionary"
             
-            # Validate data consistency
-            sectors = lists_data.get('sectors', [])
-            products = lists_data.get('products', [])
-            
-            # Check that all sectors in anchor_params exist in lists
-            for sector in bundle.anchor_params.keys():
-                if sector not in sectors:
-                    return False, f"Sector '{sector}' in anchor_params not found in sectors list"
-            
-            # Check that all products in other_params exist in lists
-            for product in bundle.other_params.keys():
-                if product not in products:
-                    return False, f"Product '{product}' in other_params not found in products list"
-            
-            # Check that all products in production exist in lists
-            for product in bundle.production.keys():
-                if product not in products:
-                    return False, f"Product '{product}' in production not found in products list"
-            
-            # Check that all products in pricing exist in lists
-            for product in bundle.pricing.keys():
-                if product not in products:
-                    return False, f"Product '{product}' in pricing not found in products list"
+            # Validate data consistency (hashed lookups; the lists may be long)
+            sectors = set(lists_data.get('sectors', []))
+            products = set(lists_data.get('products', []))
+            
+            # Check that all sectors/products keyed in each section exist in lists;
+            # a C-level set difference per section, locating the first offender only on failure
+            cross_refs = (
+                ('Sector', 'anchor_params', bundle.anchor_params, sectors, 'sectors'),
+                ('Product', 'other_params', bundle.other_params, products, 'products'),
+                ('Product', 'production', bundle.production, products, 'products'),
+                ('Product', 'pricing', bundle.pricing, products, 'products'),
+            )
+            for kind, section, mapping, known, list_name in cross_refs:
+                if mapping.keys() - known:
+                    name = next(key for key in mapping if key not in known)
+                    return False, f"{kind} '{name}' in {section} not found in {list_name} list"
             
-            # Validate primary_map entries
+            # Validate primary_map entries, keeping the parsed start years
+            primary_map_parsed: Dict[str, List[Tuple[str, float]]] = {}
             for sector, entries in bundle.primary_map.items():
                 if sector not in sectors:
                     return False, f"Sector '{sector}' in primary_map not found in sectors list"
@@ -430,13 +575,15 @@ class DataManager:
                     
                     try:
                         start_year = float(entry['start_year'])
-                        if start_year < 0:
-                            return False, (f"Start year in primary map for sector '{sector}' "
-                                         f"product '{product}' cannot be negative")
                     except (ValueError, TypeError):
                         return False, (f"Start year in primary map for sector '{sector}' "
                                      f"product '{product}' must be a valid number")
+                    if start_year < 0:
+                        return False, (f"Start year in primary map for sector '{sector}' "
+                                     f"product '{product}' cannot be negative")
+                    primary_map_parsed.setdefault(sector, []).append((product, start_year))
             
+            bundle.primary_map_parsed = primary_map_parsed
             return True, None
             
         except Exception as e:
@@ -454,6 +601,19 @@ class DataManager:
         
         return bundle.primary_map
     
+    def get_primary_map_start_years(self) -> Dict[str, List[Tuple[str, float]]]:
+        """Get the primary map as (product, start_year) pairs per sector.
+        
+        Returns:
+            Dictionary mapping sectors to (product, start_year) tuples with float
+            start years, parsed once when the bundle was validated
+        """
+        bundle = self.get_data_bundle()
+        if bundle is None or bundle.primary_map_parsed is None:
+            return {}
+        
+        return bundle.primary_map_parsed
+    
     def get_available_sectors(self) -> List[str]:
         """Get list of available sectors.
         
@@ -464,7 +624,7 @@ class DataManager:
         if bundle is None:
             return []
         
-        return bundle.lists.get('lists', {}).get('sectors', [])
+        return list(bundle.sectors)
     
     def get_available_products(self) -> List[str]:
         """Get list of available products.
@@ -476,7 +636,7 @@ class DataManager:
         if bundle is None:
             return []
         
-        return bundle.lists.get('lists', {}).get('products', [])
+        return list(bundle.products)
     
     def get_anchor_params_for_sector(self, sector: str) -> Dict[str, Any]:
         """Get anchor parameters for a specific sector.
@@ -493,45 +653,23 @@ class DataManager:
         
         return bundle.anchor_params.get(sector, {})
     
-    def get_anchor_params(self) -> Dict[str, Dict[str, Any]]:
+    def get_anchor_params(self) -> Mapping[str, Dict[str, Any]]:
         """Get all anchor parameters organized by parameter name.
         
         Returns:
-            Dictionary mapping parameter names to sector values
+            Read-only mapping of parameter names to sector values; each
+            parameter's column is built on first access
         """
-        bundle = self.get_data_bundle()
-        if bundle is None:
-            return {}
-        
-        # Reorganize data from sector-based to parameter-based
-        result = {}
-        for sector, params in bundle.anchor_params.items():
-            for param_name, value in params.items():
-                if param_name not in result:
-                    result[param_name] = {}
-                result[param_name][sector] = value
-        
-        return result
+        return self._cached_view(('anchor_params',), lambda bundle: _InvertedParamView(bundle.anchor_params), {})
     
-    def get_other_params(self) -> Dict[str, Dict[str, Any]]:
+    def get_other_params(self) -> Mapping[str, Dict[str, Any]]:
         """Get all other parameters organized by parameter name.
         
         Returns:
-            Dictionary mapping parameter names to product values
+            Read-only mapping of parameter names to product values; each
+            parameter's column is built on first access
         """
-        bundle = self.get_data_bundle()
-        if bundle is None:
-            return {}
-        
-        # Reorganize data from product-based to parameter-based
-        result = {}
-        for product, params in bundle.other_params.items():
-            for param_name, value in params.items():
-                if param_name not in result:
-                    result[param_name] = {}
-                result[param_name][product] = value
-        
-        return result
+        return self._cached_view(('other_params',), lambda bundle: _InvertedParamView(bundle.other_params), {})
     
     def get_sm_params(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
         """Get all SM mode parameters organized by parameter name.
@@ -539,28 +677,27 @@ class DataManager:
         Returns:
             Dictionary mapping parameter names to sector-product values
         """
-        bundle = self.get_data_bundle()
-        if bundle is None:
-            return {}
-        
-        # Check if SM parameters exist
-        if not hasattr(bundle, 'anchor_params_sm') or not bundle.anchor_params_sm:
-            return {}
+        return self._cached_view(('sm_params',), _build_sm_params, {})
+    
+    def _cached_view(self, key: Tuple[str, ...], build: Callable[[DataBundle], Any], default: Any) -> Any:
+        """Return a derived view of the current bundle, building it once per load.
         
-        # Reorganize data from sector-product-based to parameter-based
-        result = {}
-        for param_name, sector_data in bundle.anchor_params_sm.items():
-            if param_name not in result:
-                result[param_name] = {}
+        Args:
+            key: Cache key identifying the view
+            build: Callable deriving the view from the data bundle
+            default: Value returned when no bundle is available
             
-            for sector, product_data in sector_data.items():
-                if sector not in result[param_name]:
-                    result[param_name][sector] = {}
-                
-                for product, value in product_data.items():
-                    result[param_name][sector][product] = value
-        
-        return result
+        Returns:
+            The cached view (shared between calls; treat as read-only)
+        """
+        bundle = self.get_data_bundle()
+        if bundle is None:
+            return default
+        try:
+            return self._view_cache[key]
+        except KeyError:
+            view = self._view_cache[key] = build(bundle)
+            return view
     
     def get_other_params_for_product(self, product: str) -> Dict[str, Any]:
         """Get other parameters for a specific product.
@@ -586,25 +723,10 @@ class DataManager:
         Returns:
             List of (year, capacity) tuples
         """
-        bundle = self.get_data_bundle()
-        if bundle is None:
-            return []
-        
-        production_data = bundle.production.get(product, {})
-        if not isinstance(production_data, dict):
-            return []
-        
-        # Convert to list of tuples and sort by year
-        data_points = []
-        for year_str, capacity in production_data.items():
-            try:
-                year = float(year_str)
-                capacity_val = float(capacity)
-                data_points.append((year, capacity_val))
-            except (ValueError, TypeError):
-                continue
-        
-        return sorted(data_points, key=lambda x: x[0])
+        series = self._cached_view(
+            ('production', product), lambda bundle: _sorted_year_series(bundle.production.get(product, {})), ()
+        )
+        return list(series)
     
     def get_pricing_data_for_product(self, product: str) -> List[Tuple[float, float]]:
         """Get pricing data for a specific product.
@@ -615,31 +737,17 @@ class DataManager:
         Returns:
             List of (year, price) tuples
         """
-        bundle = self.get_data_bundle()
-        if bundle is None:
-            return []
-        
-        pricing_data = bundle.pricing.get(product, {})
-        if not isinstance(pricing_data, dict):
-            return []
-        
-        # Convert to list of tuples and sort by year
-        data_points = []
-        for year_str, price in pricing_data.items():
-            try:
-                year = float(year_str)
-                price_val = float(price)
-                data_points.append((year, price_val))
-            except (ValueError, TypeError):
-                continue
-        
-        return sorted(data_points, key=lambda x: x[0])
+        series = self._cached_view(
+            ('pricing', product), lambda bundle: _sorted_year_series(bundle.pricing.get(product, {})), ()
+        )
+        return list(series)
     
     def clear_cache(self) -> None:
-        """Clear the permissible keys cache."""
+        """Clear the permissible keys cache, derived bundle views and any cached load failure."""
         self._permissible_keys_cache.clear()
-        self._last_anchor_mode = None
-        self._last_extra_pairs = None
+        self._view_cache.clear()
+        self._load_error = None
+        self._load_error_mtime_ns = None
         logger.info("Data manager cache cleared")
     
     def reload_data(self) -> Tuple[bool, Optional[str]]:
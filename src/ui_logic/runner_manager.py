@@ -8,18 +8,95 @@ This module handles all simulation execution and monitoring operations including
 - Results processing and analysis
 """
 
+import os
+import re
 import subprocess
+import tempfile
 import time
 import threading
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Callable
+from collections import deque
+from operator import itemgetter
+from typing import Deque, Dict, List, Optional, Tuple, Callable
 import logging
 import yaml
 
+try:  # libyaml C emitter when available
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeDumper as _YamlDumper
+
 from .state_manager import StateManager
 
 logger = logging.getLogger(__name__)
 
+# Simulation entry point and its boolean CLI flags, in build_runner_command argument order
+_RUNNER_BASE_COMMAND = ("python", "simulate_growth.py")
+_RUNNER_FLAGS = ("--debug", "--visualize", "--kpi-sm-revenue-rows", "--kpi-sm-client-rows")
+
+# Bytes requested per read from the simulation's stdout pipe
+_LOG_READ_SIZE = 64 * 1024
+
+# Consecutive errors after which a status callback is dropped
+_MAX_CALLBACK_FAILURES = 10
+
+# Number of recent log lines retained on RunnerStatus
+_MAX_STATUS_LOG_LINES = 5000
+
+# Progress markers in simulation output ("step 3 of 40", "time = 2027.5")
+_STEP_RE = re.compile(r'step\s+(\d+)\s+of\s+(\d+)', re.IGNORECASE)
+_TIME_RE = re.compile(r'time\s*=\s*([\d.]+)', re.IGNORECASE)
+
+# Minimum seconds between per-line status notifications (~20 Hz)
+_NOTIFY_INTERVAL_S = 0.05
+
+# Progress change that is always notified, even inside the interval above
+_NOTIFY_PROGRESS_STEP = 0.01
+
+
+def _files_with_mtime(directory: Path, suffix: str) -> List[Tuple[float, str]]:
+    """List (mtime, path) for the regular files in `directory` ending with `suffix`.
+    
+    Uses os.scandir so the type check and the stat come from the directory
+    entry (one stat per file) instead of Path.glob plus a separate stat.
+    """
+    with os.scandir(directory) as entries:
+        return [
+            (entry.stat().st_mtime, entry.path)
+            for entry in entries
+            if entry.name.endswith(suffix) and entry.is_file()
+        ]
+
+
+def _read_tail_lines(path: Path, max_lines: int, block_size: int = 64 * 1024) -> List[str]:
+    """Read the last `max_lines` lines of a UTF-8 text file.
+    
+    Reads backwards in blocks until enough line breaks have been seen, so
+    memory is bounded by the tail rather than the whole file. Line splitting
+    matches text-mode readlines() (universal newlines); malformed bytes are
+    replaced with U+FFFD rather than failing the whole read.
+    """
+    with open(path, 'rb') as f:
+        if max_lines <= 0:
+            # Mirrors lines[-0:], which is every line
+            data, pos = f.read(), 0
+        else:
+            pos = f.seek(0, os.SEEK_END)
+            data = b''
+            while pos > 0 and data.count(b'\n') <= max_lines:
+                step = min(block_size, pos)
+                pos -= step
+                f.seek(pos)
+                data = f.read(step) + data
+    if pos > 0:
+        # Drop the partial first line (it may also start mid UTF-8 sequence)
+        data = data[data.index(b'\n') + 1:]
+    text = data.decode('utf-8', errors='replace').replace('\r\n', '\n').replace('\r', '\n')
+    lines = text.split('\n')
+    if lines[-1] == '':
+        lines.pop()
+    return lines[-max_lines:]
+
 
 class RunnerCommand:
     """Represents a runner command with all its parameters."""
@@ -62,11 +139,15 @@ class RunnerStatus:
         self.error_message: Optional[str] = None
         self.progress: float = 0.0
         self.current_step: Optional[str] = None
-        self.log_lines: List[str] = []
+        # Ring buffer: long runs keep only the most recent lines
+        self.log_lines: Deque[str] = deque(maxlen=_MAX_STATUS_LOG_LINES)
         self.last_log_update: Optional[float] = None
     
-    def to_dict(self) -> Dict:
-        """Convert to dictionary representation."""
+    def to_status_dict(self) -> Dict:
+        """Convert to a compact dictionary without the log buffer.
+        
+        Cheap enough to call on every status notification.
+        """
         return {
             'process_id': self.process_id,
             'start_time': self.start_time,
@@ -75,9 +156,14 @@ class RunnerStatus:
             'error_message': self.error_message,
             'progress': self.progress,
             'current_step': self.current_step,
-            'log_lines': self.log_lines,
             'last_log_update': self.last_log_update
         }
+    
+    def to_dict(self) -> Dict:
+        """Convert to dictionary representation, including a snapshot of the log lines."""
+        status = self.to_status_dict()
+        status['log_lines'] = list(self.log_lines)
+        return status
 
 
 class RunnerManager:
@@ -104,7 +190,13 @@ class RunnerManager:
         self.current_status = RunnerStatus()
         self._log_monitor_thread: Optional[threading.Thread] = None
         self._stop_monitoring = False
-        self._status_callbacks: List[Callable[[RunnerStatus], None]] = []
+        # Callback -> consecutive failure count (insertion-ordered; O(1) removal)
+        self._status_callbacks: Dict[Callable[[RunnerStatus], None], int] = {}
+        self._base_env: Optional[Dict[str, str]] = None
+        # Temp scenario written by run_current_scenario, pending hand-off to its log monitor
+        self._temp_scenario_path: Optional[Path] = None
+        # (starttime, stoptime) of the current run, for time-based progress
+        self._time_bounds: Optional[Tuple[float, float]] = None
         
     def build_runner_command(self, preset: Optional[str] = None, scenario_path: Optional[Path] = None,
                            debug: bool = True, visualize: bool = False,
@@ -124,7 +216,7 @@ class RunnerManager:
         """
         try:
             # Base command
-            command = ["python", "simulate_growth.py"]
+            command = list(_RUNNER_BASE_COMMAND)
             
             # Add preset or scenario path
             if preset:
@@ -134,23 +226,17 @@ class RunnerManager:
             else:
                 raise ValueError("Either preset or scenario_path must be provided")
             
-            # Add optional flags
-            if debug:
-                command.append("--debug")
+            # Add optional flags (same order as _RUNNER_FLAGS)
+            enabled = (debug, visualize, kpi_sm_revenue_rows, kpi_sm_client_rows)
+            command.extend(flag for flag, on in zip(_RUNNER_FLAGS, enabled) if on)
             
-            if visualize:
-                command.append("--visualize")
-            
-            if kpi_sm_revenue_rows:
-                command.append("--kpi-sm-revenue-rows")
-            
-            if kpi_sm_client_rows:
-                command.append("--kpi-sm-client-rows")
-            
-            # Set up environment
+            # Set up environment (takes precedence over the base environment);
+            # the running interpreter's directory goes first so "python" resolves to it
             env = {
                 'PYTHONPATH': str(self.project_root),
-                'PATH': self._get_python_path()
+                'PATH': os.pathsep.join(
+                    [str(Path(self._get_python_path()).parent), os.environ.get('PATH', '')]
+                )
             }
             
             return RunnerCommand(command, self.project_root, env)
@@ -176,12 +262,9 @@ class RunnerManager:
             self.current_process = subprocess.Popen(
                 command.command,
                 cwd=command.working_dir,
-                env={**command.env, **self._get_base_env()},
+                env={**self._get_base_env(), **command.env},
                 stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
-                universal_newlines=True
+                stderr=subprocess.STDOUT
             )
             
             # Update status
@@ -191,6 +274,10 @@ class RunnerManager:
             )
             self.current_status.is_running = True
             
+            # Snapshot the run's time bounds once rather than per progress line
+            self._time_bounds = None
+            self._time_bounds = self._get_time_bounds()
+            
             # Start log monitoring
             self._start_log_monitoring()
             
@@ -264,7 +351,7 @@ class RunnerManager:
         Args:
             callback: Function to call when status changes
         """
-        self._status_callbacks.append(callback)
+        self._status_callbacks.setdefault(callback, 0)
     
     def remove_status_callback(self, callback: Callable[[RunnerStatus], None]) -> None:
         """Remove a status callback.
@@ -272,10 +359,7 @@ class RunnerManager:
         Args:
             callback: Function to remove
         """
-        try:
-            self._status_callbacks.remove(callback)
-        except ValueError:
-            pass
+        self._status_callbacks.pop(callback, None)
     
     def _start_log_monitoring(self) -> None:
         """Start monitoring simulation logs."""
@@ -283,43 +367,106 @@ class RunnerManager:
             return
         
         self._stop_monitoring = False
-        self._log_monitor_thread = threading.Thread(target=self._monitor_logs, daemon=True)
+        # Hand the run's temp scenario (if any) to its monitor, which deletes it on exit
+        temp_scenario_path, self._temp_scenario_path = self._temp_scenario_path, None
+        self._log_monitor_thread = threading.Thread(
+            target=self._monitor_logs, args=(temp_scenario_path,), daemon=True
+        )
         self._log_monitor_thread.start()
     
     def _stop_log_monitoring(self) -> None:
-        """Stop monitoring simulation logs."""
+        """Stop monitoring simulation logs.
+        
+        The monitor is blocked in os.read() on the stdout pipe and wakes when
+        that read returns EOF (b''), which the pipe delivers once
+        stop_simulation has terminated the process; closing the pipe from
+        here would instead wait for that pending read to return.
+        """
         self._stop_monitoring = True
-        if self._log_monitor_thread:
-            self._log_monitor_thread.join(timeout=5)
+        monitor = self._log_monitor_thread
+        # A status callback may stop the run from the monitor thread itself
+        if monitor and monitor is not threading.current_thread():
+            monitor.join(timeout=5)
     
-    def _monitor_logs(self) -> None:
-        """Monitor simulation logs in a separate thread."""
+    def _monitor_logs(self, temp_scenario_path: Optional[Path] = None) -> None:
+        """Monitor simulation logs in a separate thread.
+        
+        Blocks on the child's stdout, reading raw chunks and handling the
+        complete lines in each; the loop ends at EOF, which the pipe delivers
+        when the process exits or is terminated by stop_simulation.
+        
+        Notifications for bursts of lines are coalesced to one per
+        _NOTIFY_INTERVAL_S, except that a progress change of at least
+        _NOTIFY_PROGRESS_STEP is always notified. Lines held back by the
+        interval are flushed by a timer while the read is blocked.
+        
+        Args:
+            temp_scenario_path: Temporary scenario file of this run, deleted
+                once the process is done with it
+        """
+        process = self.current_process
+        last_notify = 0.0
+        last_progress = self.current_status.progress
+        flush_timer: Optional[threading.Timer] = None
         try:
-            while not self._stop_monitoring and self.current_process:
-                if self.current_process.poll() is not None:
-                    # Process has finished
-                    break
-                
-                # Read available output
-                if self.current_process.stdout:
-                    line = self.current_process.stdout.readline()
-                    if line:
-                        line = line.strip()
-                        if line:
-                            self.current_status.log_lines.append(line)
-                            self.current_status.last_log_update = time.time()
-                            
-                            # Parse progress information
-                            self._parse_progress(line)
-                            
-                            # Notify callbacks
+            if process and process.stdout:
+                # Raw chunks from the pipe; only complete lines are decoded
+                fd = process.stdout.fileno()
+                pending = b''
+                while not self._stop_monitoring:
+                    data = os.read(fd, _LOG_READ_SIZE)
+                    if data:
+                        *lines, pending = (pending + data).split(b'\n')
+                    else:
+                        # EOF: flush a final unterminated line
+                        lines, pending = [pending], b''
+                    
+                    appended = False
+                    for raw in lines:
+                        # '\r' also ends a line, as with universal newlines
+                        for part in raw.split(b'\r'):
+                            line = part.decode('utf-8', errors='replace').strip()
+                            if line:
+                                self.current_status.log_lines.append(line)
+                                
+                                # Parse progress information
+                                self._parse_progress(line)
+                                appended = True
+                    
+                    if appended:
+                        self.current_status.last_log_update = time.time()
+                        # Notify callbacks, coalescing bursts of lines
+                        now = time.monotonic()
+                        progress = self.current_status.progress
+                        if (
+                            now - last_notify >= _NOTIFY_INTERVAL_S
+                            or abs(progress - last_progress) >= _NOTIFY_PROGRESS_STEP
+                        ):
+                            if flush_timer is not None:
+                                flush_timer.cancel()
+                                flush_timer = None
+                            last_notify = now
+                            last_progress = progress
                             self._notify_status_callbacks()
-                
-                time.sleep(0.1)  # Small delay to prevent busy waiting
-            
-            # Final status update
-            if self.current_process:
-                self.current_status.exit_code = self.current_process.returncode
+                        elif flush_timer is None or not flush_timer.is_alive():
+                            # Trailing-edge flush in case the next read blocks
+                            flush_timer = threading.Timer(
+                                _NOTIFY_INTERVAL_S - (now - last_notify), self._notify_status_callbacks
+                            )
+                            flush_timer.daemon = True
+                            flush_timer.start()
+                    
+                    if not data:
+                        break
+            
+            # Final status update (always notified, so coalesced lines are flushed)
+            if flush_timer is not None:
+                flush_timer.cancel()
+            if process:
+                if not self._stop_monitoring:
+                    # stdout reached EOF; reap the process for its exit code
+                    process.wait()
+                self.current_status.exit_code = process.returncode
                 self.current_status.is_running = False
                 self._notify_status_callbacks()
                 
@@ -327,6 +474,23 @@ class RunnerManager:
             logger.error(f"Error monitoring logs: {e}")
             self.current_status.error_message = str(e)
             self._notify_status_callbacks()
+        finally:
+            if temp_scenario_path is not None:
+                self._remove_temp_scenario(temp_scenario_path)
+    
+    def _remove_temp_scenario(self, path: Path) -> None:
+        """Delete a temporary scenario file, logging (not raising) on failure."""
+        try:
+            path.unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning(f"Could not clean up temporary scenario file: {e}")
+    
+    def _remove_temp_scenario_after_exit(self, process: subprocess.Popen, path: Path) -> None:
+        """Wait for a simulation process to exit, then delete its temporary scenario file."""
+        try:
+            process.wait()
+        finally:
+            self._remove_temp_scenario(path)
     
     def _parse_progress(self, line: str) -> None:
         """Parse progress information from log line.
@@ -336,27 +500,22 @@ class RunnerManager:
         """
         try:
             # Look for progress indicators in the log line
-            if "step" in line.lower() and "of" in line.lower():
+            step_match = _STEP_RE.search(line)
+            if step_match:
                 # Extract step information
-                import re
-                step_match = re.search(r'step\s+(\d+)\s+of\s+(\d+)', line.lower())
-                if step_match:
-                    current_step = int(step_match.group(1))
-                    total_steps = int(step_match.group(2))
-                    if total_steps > 0:
-                        self.current_status.progress = current_step / total_steps
-                        self.current_status.current_step = f"Step {current_step}/{total_steps}"
-            
-            elif "time" in line.lower() and "=" in line:
+                current_step = int(step_match.group(1))
+                total_steps = int(step_match.group(2))
+                if total_steps > 0:
+                    self.current_status.progress = current_step / total_steps
+                    self.current_status.current_step = f"Step {current_step}/{total_steps}"
+            
+            elif "=" in line:
                 # Extract time information
-                import re
-                time_match = re.search(r'time\s*=\s*([\d.]+)', line.lower())
+                time_match = _TIME_RE.search(line)
                 if time_match:
                     current_time = float(time_match.group(1))
                     # Calculate progress based on time if we have time bounds
-                    state = self.state_manager.get_state()
-                    start_time = state.runspecs.starttime
-                    stop_time = state.runspecs.stoptime
+                    start_time, stop_time = self._get_time_bounds()
                     if stop_time > start_time:
                         self.current_status.progress = (current_time - start_time) / (stop_time - start_time)
                         self.current_status.current_step = f"Time: {current_time:.2f}"
@@ -364,13 +523,39 @@ class RunnerManager:
         except Exception as e:
             logger.debug(f"Error parsing progress from line '{line}': {e}")
     
+    def _get_time_bounds(self) -> Tuple[float, float]:
+        """Get the (starttime, stoptime) of the current run.
+        
+        Returns:
+            Tuple of (starttime, stoptime), read from the state once per run
+        """
+        if self._time_bounds is None:
+            runspecs = self.state_manager.get_state().runspecs
+            self._time_bounds = (runspecs.starttime, runspecs.stoptime)
+        return self._time_bounds
+    
     def _notify_status_callbacks(self) -> None:
-        """Notify all status callbacks."""
-        for callback in self._status_callbacks:
+        """Notify all status callbacks.
+        
+        A callback that fails _MAX_CALLBACK_FAILURES times in a row is removed.
+        """
+        # Snapshot: callbacks may add or remove callbacks while being notified
+        for callback in tuple(self._status_callbacks):
             try:
                 callback(self.current_status)
             except Exception as e:
-                logger.error(f"Error in status callback: {e}")
+                failures = self._status_callbacks.get(callback)
+                if failures is None:
+                    continue
+                if failures + 1 >= _MAX_CALLBACK_FAILURES:
+                    del self._status_callbacks[callback]
+                    logger.warning(f"Removed status callback after {failures + 1} consecutive errors: {e}")
+                else:
+                    self._status_callbacks[callback] = failures + 1
+                    logger.error(f"Error in status callback: {e}")
+            else:
+                if self._status_callbacks.get(callback):
+                    self._status_callbacks[callback] = 0
     
     def get_latest_results(self) -> Optional[Path]:
         """Get the path to the latest results file.
@@ -384,13 +569,13 @@ class RunnerManager:
                 return None
             
             # Look for CSV files
-            csv_files = list(output_dir.glob("*.csv"))
+            csv_files = _files_with_mtime(output_dir, ".csv")
             if not csv_files:
                 return None
             
             # Return the most recently modified file
-            latest_file = max(csv_files, key=lambda f: f.stat().st_mtime)
-            return latest_file
+            latest_file = max(csv_files, key=itemgetter(0))[1]
+            return Path(latest_file)
             
         except Exception as e:
             logger.error(f"Error finding latest results: {e}")
@@ -408,8 +593,8 @@ class RunnerManager:
                 return []
             
             # Look for PNG files
-            png_files = list(plots_dir.glob("*.png"))
-            return sorted(png_files, key=lambda f: f.stat().st_mtime, reverse=True)
+            png_files = _files_with_mtime(plots_dir, ".png")
+            return [Path(path) for _, path in sorted(png_files, key=itemgetter(0), reverse=True)]
             
         except Exception as e:
             logger.error(f"Error finding latest plots: {e}")
@@ -429,10 +614,9 @@ class RunnerManager:
             if not log_file.exists():
                 return []
             
-            with open(log_file, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-                # Return the last max_lines
-                return [line.strip() for line in lines[-max_lines:] if line.strip()]
+            # Return the last max_lines
+            lines = _read_tail_lines(log_file, max_lines)
+            return [line.strip() for line in lines if line.strip()]
                 
         except Exception as e:
             logger.error(f"Error reading log file: {e}")
@@ -486,10 +670,13 @@ class RunnerManager:
         try:
             # Save current state to temporary scenario file
             scenario_data = self.state_manager.to_scenario_dict_normalized()
-            temp_scenario_path = self.project_root / "scenarios" / f"temp_{int(time.time())}.yaml"
-            
-            with open(temp_scenario_path, 'w', encoding='utf-8') as f:
-                yaml.dump(scenario_data, f, default_flow_style=False, sort_keys=False)
+            # Unique name per run (a timestamp name collides for runs within the same second)
+            with tempfile.NamedTemporaryFile(
+                mode='w', encoding='utf-8', prefix='temp_', suffix='.yaml',
+                dir=self.project_root / "scenarios", delete=False
+            ) as f:
+                temp_scenario_path = Path(f.name)
+                yaml.dump(scenario_data, f, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False)
             
             # Build command
             command = self.build_runner_command(
@@ -500,20 +687,22 @@ class RunnerManager:
                 kpi_sm_client_rows=kpi_sm_client_rows
             )
             
-            # Start simulation
+            # Start simulation; its log monitor deletes the file once the process exits
+            self._temp_scenario_path = temp_scenario_path
             success, error = self.start_simulation(command)
-            
-            # Clean up temporary file after a delay
-            def cleanup_temp_file():
-                time.sleep(5)  # Wait for simulation to start
-                try:
-                    if temp_scenario_path.exists():
-                        temp_scenario_path.unlink()
-                except Exception as e:
-                    logger.warning(f"Could not clean up temporary scenario file: {e}")
-            
-            cleanup_thread = threading.Thread(target=cleanup_temp_file, daemon=True)
-            cleanup_thread.start()
+            if self._temp_scenario_path is not None:
+                # No monitor took ownership of the file
+                self._temp_scenario_path = None
+                if not success:
+                    self._remove_temp_scenario(temp_scenario_path)
+                else:
+                    # The previous monitor was still alive, so none was started for
+                    # this run; delete the file only once the child has exited
+                    threading.Thread(
+                        target=self._remove_temp_scenario_after_exit,
+                        args=(self.current_process, temp_scenario_path),
+                        daemon=True
+                    ).start()
             
             return success, error
             
@@ -534,16 +723,23 @@ class RunnerManager:
     def _get_base_env(self) -> Dict[str, str]:
         """Get base environment variables.
         
+        Built once per manager from the process environment.
+        
         Returns:
-            Base environment variables
+            Base environment variables (shared; do not mutate)
         """
-        import os
+        if self._base_env is not None:
+            return self._base_env
+        
         env = os.environ.copy()
         
         # Add project-specific environment variables
         env.update({
             'PYTHONPATH': str(self.project_root),
             'GROWTH_MODEL_ROOT': str(self.project_root),
+            # Child stdout is a pipe; keep it unbuffered so log/progress lines stream as written
+            'PYTHONUNBUFFERED': '1',
         })
         
+        self._base_env = env
         return env
@@ -7,15 +7,129 @@ any UI framework and provides pure business logic.
 """
 
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, Iterator, List, Optional, Tuple, Any
+import copy
 import logging
+import os
+import re
 import yaml
 import json
 
+try:  # libyaml C parser/emitter when available
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
+try:  # Optional faster JSON codec; the stdlib json module remains the reference
+    import orjson
+except ImportError:  # pragma: no cover - exercised only when orjson is absent
+    orjson = None
+
 from .state_manager import StateManager
 
 logger = logging.getLogger(__name__)
 
+# Parsed scenario files kept in memory, least recently used evicted first
+_PARSE_CACHE_SIZE = 64
+
+# Shared read-only default for absent mapping blocks; never handed to callers
+_EMPTY: Dict[str, Any] = {}
+
+# File extensions recognised as scenario files
+_YAML_SUFFIXES = ('.yaml', '.yml')
+_JSON_SUFFIX = '.json'
+_SCENARIO_SUFFIXES = _YAML_SUFFIXES + (_JSON_SUFFIX,)
+
+# Top-level 'name:' lines and YAML document markers, for byte-level duplication
+_TOP_LEVEL_NAME_RE = re.compile(rb'^name:.*$', re.MULTILINE)
+_DOCUMENT_MARKER_RE = re.compile(rb'^(?:---|\.\.\.)', re.MULTILINE)
+
+# Sidecar index of per-file summary info, kept alongside the scenarios
+_INDEX_FILENAME = ".index.json"
+
+if _YamlLoader is yaml.SafeLoader:  # pragma: no cover - depends on the PyYAML build
+    logger.warning("PyYAML was built without libyaml; scenario files use the slower pure-Python loader")
+
+
+class _ScenarioDumper(_YamlDumper):
+    """Block-style dumper that writes all-numeric lists (e.g. [t, v] point pairs) in flow style.
+
+    Repeated objects are written out in full rather than as YAML anchors and
+    aliases, since exported scenario blocks may share dicts with each other.
+    """
+
+    def ignore_aliases(self, data: Any) -> bool:
+        return True
+
+
+def _represent_list(dumper: _ScenarioDumper, data: list) -> yaml.Node:
+    numeric = bool(data) and all(isinstance(item, (int, float)) for item in data)
+    return dumper.represent_sequence('tag:yaml.org,2002:seq', data, flow_style=True if numeric else None)
+
+
+_ScenarioDumper.add_representer(list, _represent_list)
+
+# Options for writing scenario YAML; lines are never wrapped
+_YAML_DUMP_OPTIONS = {
+    'Dumper': _ScenarioDumper,
+    'default_flow_style': False,
+    'sort_keys': False,
+    'allow_unicode': True,
+    'width': 2**31 - 1,
+}
+
+
+def _parse_json_bytes(raw: bytes) -> Any:
+    """Parse JSON from raw bytes, using orjson when available.
+
+    Documents orjson rejects (e.g. NaN/Infinity literals) are re-parsed with
+    the stdlib so accepted inputs and error messages match ``json.loads``.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
+
+
+def _dump_json_bytes(data: Any) -> bytes:
+    """Serialize scenario data as 2-space indented UTF-8 JSON.
+
+    Always uses the stdlib: orjson writes NaN/Infinity as ``null``, which
+    would not round-trip through ``validate_scenario_data``.
+    """
+    return json.dumps(data, indent=2, sort_keys=False).encode('utf-8')
+
+
+def _is_scenario_entry(entry: os.DirEntry) -> bool:
+    """Whether a directory entry is a (non-hidden) scenario file."""
+    return (
+        entry.name.endswith(_SCENARIO_SUFFIXES)
+        and not entry.name.startswith('.')
+        and entry.is_file()
+    )
+
+
+def _scenario_info(data: Dict, default_name: str) -> Dict[str, Any]:
+    """Extract the summary information reported for a scenario.
+
+    Missing or null override blocks count as empty.
+    """
+    overrides = data.get('overrides') or _EMPTY
+    constants = overrides.get('constants') or _EMPTY
+    points = overrides.get('points') or _EMPTY
+    return {
+        'name': data.get('name', default_name),
+        'runspecs': data.get('runspecs', {}),
+        'has_constants': bool(constants),
+        'has_points': bool(points),
+        'has_primary_map': bool(overrides.get('primary_map')),
+        'has_seeds': bool(data.get('seeds')),
+        'constants_count': len(constants),
+        'points_count': len(points),
+    }
+
 
 class ScenarioManager:
     """
@@ -38,7 +152,10 @@ class ScenarioManager:
         """
         self.scenarios_dir = Path(scenarios_dir)
         self.state_manager = state_manager
-        self.scenarios_dir.mkdir(exist_ok=True)
+        if not self.scenarios_dir.is_dir():
+            self.scenarios_dir.mkdir(exist_ok=True)
+        # Parsed file contents keyed by path, valid while (mtime_ns, size) match
+        self._parse_cache: Dict[Path, Tuple[Tuple[int, int], Dict]] = {}
         
     def list_available_scenarios(self) -> List[Path]:
         """List all available scenario files.
@@ -47,18 +164,48 @@ class ScenarioManager:
             List of Path objects for scenario files
         """
         try:
-            scenario_files = []
-            for file_path in self.scenarios_dir.glob("*.yaml"):
-                scenario_files.append(file_path)
-            for file_path in self.scenarios_dir.glob("*.yml"):
-                scenario_files.append(file_path)
-            for file_path in self.scenarios_dir.glob("*.json"):
-                scenario_files.append(file_path)
-            return sorted(scenario_files)
+            return [self.scenarios_dir / entry.name for entry in self._scan_scenario_entries()]
         except Exception as e:
             logger.error(f"Error listing scenarios: {e}")
             return []
     
+    def iter_available_scenarios(self) -> Iterator[Path]:
+        """Yield scenario files lazily, in directory order (unsorted).
+        
+        Suited to consumers that stop early (first match, first page); use
+        list_available_scenarios for the sorted list. Errors reading the
+        directory propagate to the caller.
+        
+        Yields:
+            Path objects for scenario files
+        """
+        with os.scandir(self.scenarios_dir) as entries:
+            for entry in entries:
+                if _is_scenario_entry(entry):
+                    yield self.scenarios_dir / entry.name
+    
+    def _scan_scenario_entries(self) -> List[os.DirEntry]:
+        """Scenario file entries from one directory read, sorted by name.
+        
+        The entries' stat() results are cached on the DirEntry (and come from
+        the directory read itself on some platforms), so callers needing
+        mtimes and sizes can use them instead of stat-ing each Path.
+        """
+        with os.scandir(self.scenarios_dir) as entries:
+            scenario_entries = [entry for entry in entries if _is_scenario_entry(entry)]
+        scenario_entries.sort(key=lambda entry: entry.name)
+        return scenario_entries
+    
+    def _candidate_paths(self, scenario_name: str) -> List[Path]:
+        """Files a scenario name may refer to, in lookup order.
+        
+        A name that already carries a scenario extension is taken as the file
+        name; otherwise each extension is tried in turn.
+        """
+        if scenario_name.endswith(_SCENARIO_SUFFIXES):
+            return [self.scenarios_dir / scenario_name]
+        return [self.scenarios_dir / f"{scenario_name}{ext}" for ext in _SCENARIO_SUFFIXES]
+    
     def load_scenario(self, scenario_name: str) -> Tuple[bool, Optional[str], Optional[Dict]]:
         """Load a scenario by name.
         
@@ -69,16 +216,13 @@ class ScenarioManager:
             Tuple of (success, error_message, scenario_data)
         """
         try:
-            # Try different extensions
-            for ext in [".yaml", ".yml", ".json"]:
-                file_path = self.scenarios_dir / f"{scenario_name}{ext}"
-                if file_path.exists():
-                    return self._load_scenario_file(file_path)
-            
-            # If no extension provided, try with .yaml
-            file_path = self.scenarios_dir / f"{scenario_name}.yaml"
-            if file_path.exists():
-                return self._load_scenario_file(file_path)
+            # Try each candidate file; the stat result is reused by the loader
+            for file_path in self._candidate_paths(scenario_name):
+                try:
+                    st = file_path.stat()
+                except FileNotFoundError:
+                    continue
+                return self._load_scenario_file(file_path, st)
             
             return False, f"Scenario '{scenario_name}' not found", None
             
@@ -87,29 +231,51 @@ class ScenarioManager:
             logger.error(error_msg)
             return False, error_msg, None
     
-    def _load_scenario_file(self, file_path: Path) -> Tuple[bool, Optional[str], Optional[Dict]]:
+    def _load_scenario_file(
+        self,
+        file_path: Path,
+        stat_result: Optional[os.stat_result] = None
+    ) -> Tuple[bool, Optional[str], Optional[Dict]]:
         """Load a scenario from a specific file.
         
+        Files unchanged since their last parse are served from the parse
+        cache; callers always receive their own copy of the data.
+        
         Args:
             file_path: Path to the scenario file
+            stat_result: The file's stat result, if the caller already has one
             
         Returns:
             Tuple of (success, error_message, scenario_data)
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                if file_path.suffix.lower() in ['.yaml', '.yml']:
-                    data = yaml.safe_load(f)
-                elif file_path.suffix.lower() == '.json':
-                    data = json.load(f)
-                else:
-                    return False, f"Unsupported file format: {file_path.suffix}", None
-                
-                if not isinstance(data, dict):
-                    return False, "Invalid scenario file: root must be a dictionary", None
-                
-                return True, None, data
-                
+            st = stat_result if stat_result is not None else file_path.stat()
+            signature = (st.st_mtime_ns, st.st_size)
+            cached = self._parse_cache.pop(file_path, None)
+            if cached is not None and cached[0] == signature:
+                self._parse_cache[file_path] = cached
+                return True, None, copy.deepcopy(cached[1])
+            
+            # Both parsers take UTF-8 bytes directly, so skip the text layer
+            suffix = file_path.suffix.lower()
+            if suffix in _YAML_SUFFIXES:
+                with open(file_path, 'rb') as f:
+                    data = yaml.load(f, Loader=_YamlLoader)
+            elif suffix == _JSON_SUFFIX:
+                with open(file_path, 'rb') as f:
+                    data = _parse_json_bytes(f.read())
+            else:
+                return False, f"Unsupported file format: {file_path.suffix}", None
+            
+            if not isinstance(data, dict):
+                return False, "Invalid scenario file: root must be a dictionary", None
+            
+            if len(self._parse_cache) >= _PARSE_CACHE_SIZE:
+                del self._parse_cache[next(iter(self._parse_cache))]
+            self._parse_cache[file_path] = (signature, data)
+            
+            return True, None, copy.deepcopy(data)
+            
         except yaml.YAMLError as e:
             error_msg = f"YAML parsing error in {file_path}: {e}"
             logger.error(error_msg)
@@ -141,7 +307,7 @@ class ScenarioManager:
         """
         try:
             # Ensure filename has .yaml extension
-            if not filename.endswith(('.yaml', '.yml', '.json')):
+            if not filename.endswith(_SCENARIO_SUFFIXES):
                 filename = f"{filename}.yaml"
             
             file_path = self.scenarios_dir / filename
@@ -151,14 +317,18 @@ class ScenarioManager:
                 return False, f"File {filename} already exists. Use overwrite=True to overwrite.", None
             
             # Save the file
-            with open(file_path, 'w', encoding='utf-8') as f:
-                if file_path.suffix.lower() in ['.yaml', '.yml']:
-                    yaml.dump(scenario_data, f, default_flow_style=False, sort_keys=False)
-                elif file_path.suffix.lower() == '.json':
-                    json.dump(scenario_data, f, indent=2, sort_keys=False)
-                else:
-                    return False, f"Unsupported file format: {file_path.suffix}", None
-            
+            self._parse_cache.pop(file_path, None)
+            suffix = file_path.suffix.lower()
+            if suffix in _YAML_SUFFIXES:
+                with open(file_path, 'w', encoding='utf-8') as f:
+                    yaml.dump(scenario_data, f, **_YAML_DUMP_OPTIONS)
+            elif suffix == _JSON_SUFFIX:
+                with open(file_path, 'wb') as f:
+                    f.write(_dump_json_bytes(scenario_data))
+            else:
+                return False, f"Unsupported file format: {file_path.suffix}", None
+            
+            self._update_index_entry(file_path, scenario_data)
             logger.info(f"Scenario saved to {file_path}")
             return True, None, file_path
             
@@ -178,6 +348,11 @@ class ScenarioManager:
             Tuple of (success, error_message, file_path)
         """
         try:
+            # Copy the file as-is when only its name line needs rewriting
+            result = self._duplicate_by_copy(source_name, new_name)
+            if result is not None:
+                return result
+            
             # Load the source scenario
             success, error, data = self.load_scenario(source_name)
             if not success:
@@ -194,6 +369,74 @@ class ScenarioManager:
             logger.error(error_msg)
             return False, error_msg, None
     
+    def _duplicate_by_copy(
+        self,
+        source_name: str,
+        new_name: str
+    ) -> Optional[Tuple[bool, Optional[str], Optional[Path]]]:
+        """Duplicate a YAML scenario by rewriting only its top-level name line.
+        
+        Applies only when the source already has a fresh parse in the cache
+        (so it is known to be valid) and the name is a single plain line that
+        parses to the cached value. Returns None whenever that does not hold,
+        leaving the caller to load and re-save.
+        """
+        filename = new_name if new_name.endswith(_SCENARIO_SUFFIXES) else f"{new_name}.yaml"
+        if not filename.endswith(_YAML_SUFFIXES):
+            return None
+        
+        for source_path in self._candidate_paths(source_name):
+            try:
+                st = source_path.stat()
+            except FileNotFoundError:
+                continue
+            break
+        else:
+            return None
+        
+        cached = self._parse_cache.get(source_path)
+        if (
+            not source_path.name.endswith(_YAML_SUFFIXES)
+            or cached is None
+            or cached[0] != (st.st_mtime_ns, st.st_size)
+        ):
+            return None
+        
+        raw = source_path.read_bytes()
+        matches = list(_TOP_LEVEL_NAME_RE.finditer(raw))
+        if len(matches) != 1 or _DOCUMENT_MARKER_RE.search(raw):
+            return None
+        match = matches[0]
+        start, end = match.span()
+        # A continuation line would mean a multi-line value
+        if raw[end + 1:end + 2] in (b' ', b'\t'):
+            return None
+        # Anchors, aliases, tags and comments on the name line would be lost by the rewrite
+        value = match.group()[len(b'name:'):]
+        if any(marker in value for marker in (b'&', b'*', b'!', b'#')):
+            return None
+        try:
+            if yaml.load(match.group(), Loader=_YamlLoader) != {'name': cached[1].get('name')}:
+                return None
+        except yaml.YAMLError:
+            return None
+        
+        new_line = yaml.dump({'name': new_name}, **_YAML_DUMP_OPTIONS).encode('utf-8')
+        if new_line.count(b'\n') != 1:
+            return None
+        new_line = new_line[:-1] + (b'\r' if match.group().endswith(b'\r') else b'')
+        
+        file_path = self.scenarios_dir / filename
+        try:
+            with open(file_path, 'xb') as f:
+                f.write(raw[:start] + new_line + raw[end:])
+        except FileExistsError:
+            return None
+        
+        self._update_index_entry(file_path, dict(cached[1], name=new_name))
+        logger.info(f"Scenario saved to {file_path}")
+        return True, None, file_path
+    
     def delete_scenario(self, scenario_name: str) -> Tuple[bool, Optional[str]]:
         """Delete a scenario file.
         
@@ -204,18 +447,14 @@ class ScenarioManager:
             Tuple of (success, error_message)
         """
         try:
-            # Try different extensions
-            for ext in [".yaml", ".yml", ".json"]:
-                file_path = self.scenarios_dir / f"{scenario_name}{ext}"
-                if file_path.exists():
+            # Try each candidate file; a missing file costs one failed unlink
+            for file_path in self._candidate_paths(scenario_name):
+                try:
                     file_path.unlink()
-                    logger.info(f"Deleted scenario {file_path}")
-                    return True, None
-            
-            # If no extension provided, try with .yaml
-            file_path = self.scenarios_dir / f"{scenario_name}.yaml"
-            if file_path.exists():
-                file_path.unlink()
+                except FileNotFoundError:
+                    continue
+                self._parse_cache.pop(file_path, None)
+                self._update_index_entry(file_path, None)
                 logger.info(f"Deleted scenario {file_path}")
                 return True, None
             
@@ -290,19 +529,7 @@ class ScenarioManager:
             if not success:
                 return False, error, None
             
-            # Extract basic information
-            info = {
-                'name': data.get('name', scenario_name),
-                'runspecs': data.get('runspecs', {}),
-                'has_constants': bool(data.get('overrides', {}).get('constants')),
-                'has_points': bool(data.get('overrides', {}).get('points')),
-                'has_primary_map': bool(data.get('overrides', {}).get('primary_map')),
-                'has_seeds': bool(data.get('seeds')),
-                'constants_count': len(data.get('overrides', {}).get('constants', {})),
-                'points_count': len(data.get('overrides', {}).get('points', {})),
-            }
-            
-            return True, None, info
+            return True, None, _scenario_info(data, scenario_name)
             
         except Exception as e:
             error_msg = f"Error getting info for scenario '{scenario_name}': {e}"
@@ -374,9 +601,10 @@ class ScenarioManager:
                 for i, point in enumerate(series):
                     if not isinstance(point, (list, tuple)) or len(point) != 2:
                         return False, f"Point {i} in series '{key}' must be a list/tuple of 2 numbers"
+                    x, y = point
                     try:
-                        float(point[0])
-                        float(point[1])
+                        float(x)
+                        float(y)
                     except (ValueError, TypeError):
                         return False, f"Point {i} in series '{key}' must contain numbers"
             
@@ -428,27 +656,109 @@ class ScenarioManager:
     def get_scenario_summary(self) -> Dict[str, Any]:
         """Get a summary of all available scenarios.
         
+        Per-file info comes from the sidecar index when the file's mtime and
+        size still match; only new or changed files are parsed, and the
+        index is rewritten when any entry changed.
+        
         Returns:
             Dictionary with scenario summary information
         """
         try:
-            scenarios = self.list_available_scenarios()
+            # One directory read supplies names, mtimes and sizes
+            scenarios = self._scan_scenario_entries()
             summary = {
                 'total_scenarios': len(scenarios),
                 'scenarios': []
             }
             
-            for scenario_path in scenarios:
-                success, error, info = self.get_scenario_info(scenario_path.stem)
-                if success and info:
-                    summary['scenarios'].append({
-                        'name': scenario_path.stem,
-                        'path': str(scenario_path),
-                        'info': info
-                    })
+            # Info for a stem comes from the file load_scenario would pick
+            by_name = {dir_entry.name: dir_entry for dir_entry in scenarios}
+            index = self._read_index()
+            index_changed = False
+            
+            for dir_entry in scenarios:
+                stem = os.path.splitext(dir_entry.name)[0]
+                source = next(
+                    by_name[name] for name in (f"{stem}.yaml", f"{stem}.yml", f"{stem}.json") if name in by_name
+                )
+                try:
+                    st = source.stat()
+                    entry = index.get(source.name)
+                    if (
+                        isinstance(entry, dict)
+                        and entry.get('mtime_ns') == st.st_mtime_ns
+                        and entry.get('size') == st.st_size
+                    ):
+                        info = entry['info']
+                    else:
+                        success, error, data = self._load_scenario_file(self.scenarios_dir / source.name, st)
+                        if not success:
+                            continue
+                        info = _scenario_info(data, stem)
+                        index[source.name] = {'mtime_ns': st.st_mtime_ns, 'size': st.st_size, 'info': info}
+                        index_changed = True
+                except Exception as e:
+                    logger.error(f"Error getting info for scenario '{stem}': {e}")
+                    continue
+                
+                summary['scenarios'].append({
+                    'name': stem,
+                    'path': str(self.scenarios_dir / dir_entry.name),
+                    'info': info
+                })
+            
+            # Drop entries for files that no longer exist
+            for name in [name for name in index if name not in by_name]:
+                del index[name]
+                index_changed = True
+            
+            if index_changed:
+                self._write_index(index)
             
             return summary
             
         except Exception as e:
             logger.error(f"Error getting scenario summary: {e}")
             return {'total_scenarios': 0, 'scenarios': []}
+    
+    def _read_index(self) -> Dict[str, Any]:
+        """Read the sidecar summary index, or an empty one if missing or unreadable."""
+        try:
+            with open(self.scenarios_dir / _INDEX_FILENAME, 'rb') as f:
+                index = _parse_json_bytes(f.read())
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable scenario index: {e}")
+            return {}
+        return index if isinstance(index, dict) else {}
+    
+    def _write_index(self, index: Dict[str, Any]) -> None:
+        """Atomically replace the sidecar summary index; failures are only logged."""
+        index_path = self.scenarios_dir / _INDEX_FILENAME
+        tmp_path = index_path.with_name(f"{_INDEX_FILENAME}.{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(_dump_json_bytes(index))
+            os.replace(tmp_path, index_path)
+        except Exception as e:
+            logger.warning(f"Could not write scenario index: {e}")
+            tmp_path.unlink(missing_ok=True)
+    
+    def _update_index_entry(self, file_path: Path, scenario_data: Optional[Dict]) -> None:
+        """Refresh (or with None, remove) a file's entry in the sidecar index."""
+        index = self._read_index()
+        if scenario_data is None:
+            if index.pop(file_path.name, None) is None:
+                return
+        else:
+            try:
+                st = file_path.stat()
+                info = _scenario_info(scenario_data, file_path.stem)
+            except Exception:
+                # Leave it to the next summary to parse the file
+                if index.pop(file_path.name, None) is None:
+                    return
+            else:
+                index[file_path.name] = {'mtime_ns': st.st_mtime_ns, 'size': st.st_size, 'info': info}
+        self._write_index(index)
@@ -5,9 +5,12 @@ This module provides reactive state management that can be used by any UI framew
 It handles all application state including scenarios, runspecs, overrides, and UI state.
 """
 
-from dataclasses import dataclass, field, asdict
-from typing import Dict, List, Tuple, Optional, Any, Callable
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field, fields
+from typing import Deque, Dict, Iterator, List, Tuple, Optional, Any, Callable
 from enum import Enum
+from operator import itemgetter
 import logging
 
 logger = logging.getLogger(__name__)
@@ -24,7 +27,7 @@ class TabType(Enum):
     SEEDS = "seeds"
 
 
-@dataclass
+@dataclass(slots=True)
 class RunspecsState:
     """Runspecs configuration with safe defaults.
     
@@ -37,7 +40,14 @@ class RunspecsState:
     anchor_mode: str = "sector"
 
 
-@dataclass
+# Sort key for (time, value) point rows
+_POINT_TIME = itemgetter(0)
+
+# Runspecs field names in declaration order, for scalar-only dict export
+_RUNSPECS_FIELDS = tuple(f.name for f in fields(RunspecsState))
+
+
+@dataclass(slots=True)
 class ScenarioOverridesState:
     """Holds override maps for constants and points (lookups).
     
@@ -48,20 +58,20 @@ class ScenarioOverridesState:
     points: Dict[str, List[Tuple[float, float]]] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class PrimaryMapEntry:
     """Represents a mapping of a single product to a sector with a start year."""
     product: str
     start_year: float
 
 
-@dataclass
+@dataclass(slots=True)
 class PrimaryMapState:
     """Holds proposed primary map replacements per sector."""
     by_sector: Dict[str, List[PrimaryMapEntry]] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class SeedsState:
     """Holds seeding configuration for the scenario."""
     active_anchor_clients: Dict[str, int] = field(default_factory=dict)
@@ -73,7 +83,7 @@ class SeedsState:
     completed_projects_sm: Dict[str, Dict[str, int]] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class RunnerState:
     """State for the runner tab and execution controls."""
     is_running: bool = False
@@ -87,7 +97,7 @@ class RunnerState:
     last_results_path: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class LogsState:
     """State for the logs tab."""
     log_lines: List[str] = field(default_factory=list)
@@ -96,7 +106,7 @@ class LogsState:
     filter_text: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class OutputState:
     """State for the output tab."""
     results_data: Optional[Any] = None  # DataFrame or similar
@@ -105,7 +115,7 @@ class OutputState:
     export_format: str = "csv"
 
 
-@dataclass
+@dataclass(slots=True)
 class UIState:
     """Aggregate UI state for the entire application."""
     name: str = "working_scenario"
@@ -119,6 +129,10 @@ class UIState:
     output: OutputState = field(default_factory=OutputState)
 
 
+# Seeds field names in declaration order (the order they are exported in)
+_SEEDS_FIELDS = tuple(f.name for f in fields(SeedsState))
+
+
 class StateManager:
     """
     Framework-agnostic state manager with reactive patterns.
@@ -130,27 +144,60 @@ class StateManager:
     def __init__(self):
         """Initialize the state manager with default state."""
         self._state = UIState()
-        self._listeners: Dict[str, List[Callable]] = {}
-        self._history: List[UIState] = []
+        # Callbacks per event as immutable tuples, rebuilt on (un)subscribe
+        self._listeners: Dict[str, Tuple[Callable, ...]] = {}
         self._max_history = 50
+        # Bounded undo history; the oldest snapshot drops off automatically
+        self._history: Deque[UIState] = deque(maxlen=self._max_history)
+        # Scenario dict exports, each paired with the state object it was built from
+        self._scenario_dict_cache: Optional[Tuple[UIState, dict]] = None
+        self._scenario_dict_normalized_cache: Optional[Tuple[UIState, dict]] = None
+        # Nesting depth of batch() blocks and the state they started from
+        self._batch_depth = 0
+        self._batch_base: Optional[UIState] = None
         
     def get_state(self) -> UIState:
         """Get the current application state."""
         return self._state
     
     def set_state(self, new_state: UIState) -> None:
-        """Set the entire application state and notify listeners."""
+        """Set the entire application state and notify listeners.
+        
+        Inside a batch() block the state is only swapped; history and
+        listeners see a single change when the outermost block exits.
+        """
         old_state = self._state
         self._state = new_state
+        if self._batch_depth:
+            return
         
         # Add to history
         self._history.append(old_state)
-        if len(self._history) > self._max_history:
-            self._history.pop(0)
         
         # Notify all listeners
         self._notify_listeners("state_changed", old_state, new_state)
         
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Coalesce the state changes made inside the block into one.
+        
+        Blocks may nest. On exit of the outermost block, if the state
+        changed, one history entry is recorded and listeners are notified
+        once with the pre-batch and final states.
+        """
+        if self._batch_depth == 0:
+            self._batch_base = self._state
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                old_state, self._batch_base = self._batch_base, None
+                if old_state is not self._state:
+                    self._history.append(old_state)
+                    self._notify_listeners("state_changed", old_state, self._state)
+    
     def update_state(self, **kwargs) -> None:
         """Update specific parts of the state."""
         current_state = self._state
@@ -203,6 +250,7 @@ class StateManager:
             elapsed_quarters=kwargs.get("elapsed_quarters", current_seeds.elapsed_quarters),
             direct_clients=kwargs.get("direct_clients", current_seeds.direct_clients),
             active_anchor_clients_sm=kwargs.get("active_anchor_clients_sm", current_seeds.active_anchor_clients_sm),
+            elapsed_quarters_sm=kwargs.get("elapsed_quarters_sm", current_seeds.elapsed_quarters_sm),
             completed_projects=kwargs.get("completed_projects", current_seeds.completed_projects),
             completed_projects_sm=kwargs.get("completed_projects_sm", current_seeds.completed_projects_sm),
         )
@@ -252,26 +300,26 @@ class StateManager:
     
     def add_listener(self, event: str, callback: Callable) -> None:
         """Add a listener for state change events."""
-        if event not in self._listeners:
-            self._listeners[event] = []
-        self._listeners[event].append(callback)
+        self._listeners[event] = self._listeners.get(event, ()) + (callback,)
     
     def remove_listener(self, event: str, callback: Callable) -> None:
         """Remove a listener for state change events."""
-        if event in self._listeners:
-            try:
-                self._listeners[event].remove(callback)
-            except ValueError:
-                pass
+        callbacks = self._listeners.get(event, ())
+        if callback in callbacks:
+            index = callbacks.index(callback)
+            self._listeners[event] = callbacks[:index] + callbacks[index + 1:]
     
     def _notify_listeners(self, event: str, *args, **kwargs) -> None:
-        """Notify all listeners for a specific event."""
-        if event in self._listeners:
-            for callback in self._listeners[event]:
-                try:
-                    callback(*args, **kwargs)
-                except Exception as e:
-                    logger.error(f"Error in state listener callback: {e}")
+        """Notify all listeners for a specific event.
+        
+        Iterates the tuple current at dispatch time, so callbacks may
+        (un)subscribe without affecting this round.
+        """
+        for callback in self._listeners.get(event, ()):
+            try:
+                callback(*args, **kwargs)
+            except Exception as e:
+                logger.error(f"Error in state listener callback: {e}")
     
     def undo(self) -> bool:
         """Undo the last state change if possible."""
@@ -287,54 +335,45 @@ class StateManager:
         return len(self._history) > 0
     
     def to_scenario_dict(self) -> dict:
-        """Convert current state to scenario dictionary format."""
+        """Convert current state to scenario dictionary format.
+        
+        The result is memoized until the state changes (every update replaces
+        the state object) and is shared between callers, so treat it as
+        read-only.
+        """
+        cached = self._scenario_dict_cache
+        if cached is not None and cached[0] is self._state:
+            return cached[1]
+        out = self._build_scenario_dict()
+        self._scenario_dict_cache = (self._state, out)
+        return out
+    
+    def _build_scenario_dict(self) -> dict:
+        """Build the scenario dictionary for the current state.
+        
+        Constants and seed maps alias the state's own dicts rather than
+        copying them; state dicts are replaced, never edited, on update.
+        """
         pm_block: Optional[Dict[str, List[Dict[str, float]]]] = None
         if self._state.primary_map.by_sector:
             pm_block = {}
             for sector, entries in self._state.primary_map.by_sector.items():
                 pm_block[sector] = [{"product": e.product, "start_year": float(e.start_year)} for e in entries]
 
-        seeds_block: Optional[dict] = None
-        if (
-            self._state.seeds.active_anchor_clients
-            or self._state.seeds.elapsed_quarters
-            or self._state.seeds.direct_clients
-            or self._state.seeds.active_anchor_clients_sm
-            or self._state.seeds.elapsed_quarters_sm
-            or self._state.seeds.completed_projects
-            or self._state.seeds.completed_projects_sm
-        ):
-            seeds_block = {}
-            if self._state.seeds.active_anchor_clients:
-                seeds_block["active_anchor_clients"] = dict(self._state.seeds.active_anchor_clients)
-            if self._state.seeds.elapsed_quarters:
-                seeds_block["elapsed_quarters"] = dict(self._state.seeds.elapsed_quarters)
-            if self._state.seeds.direct_clients:
-                seeds_block["direct_clients"] = dict(self._state.seeds.direct_clients)
-            if self._state.seeds.active_anchor_clients_sm:
-                seeds_block["active_anchor_clients_sm"] = {
-                    s: dict(mmap) for s, mmap in self._state.seeds.active_anchor_clients_sm.items()
-                }
-            if self._state.seeds.elapsed_quarters_sm:
-                seeds_block["elapsed_quarters_sm"] = {
-                    s: dict(mmap) for s, mmap in self._state.seeds.elapsed_quarters_sm.items()
-                }
-            if self._state.seeds.completed_projects:
-                seeds_block["completed_projects"] = dict(self._state.seeds.completed_projects)
-            if self._state.seeds.completed_projects_sm:
-                seeds_block["completed_projects_sm"] = {
-                    s: dict(mmap) for s, mmap in self._state.seeds.completed_projects_sm.items()
-                }
+        # Seed maps are exported by reference (in declaration order, non-empty only)
+        seeds = self._state.seeds
+        seeds_block = {name: value for name in _SEEDS_FIELDS if (value := getattr(seeds, name))}
 
         overrides_block: dict = {
-            "constants": dict(self._state.overrides.constants),
+            "constants": self._state.overrides.constants,
         }
         if pm_block:
             overrides_block["primary_map"] = pm_block
 
+        runspecs = self._state.runspecs
         out: dict = {
             "name": self._state.name,
-            "runspecs": asdict(self._state.runspecs),
+            "runspecs": {name: getattr(runspecs, name) for name in _RUNSPECS_FIELDS},
             "overrides": overrides_block,
         }
         if seeds_block:
@@ -342,26 +381,42 @@ class StateManager:
         return out
 
     def to_scenario_dict_normalized(self) -> dict:
-        """Convert current state to normalized scenario dictionary format."""
+        """Convert current state to normalized scenario dictionary format.
+        
+        Memoized and shared like to_scenario_dict; treat it as read-only.
+        """
+        cached = self._scenario_dict_normalized_cache
+        if cached is not None and cached[0] is self._state:
+            return cached[1]
+        
         points_map: Dict[str, List[List[float]]] = {}
         for name, series in self._state.overrides.points.items():
             # Ensure list-of-lists shape for YAML/JSON dumps and validation
             points_map[name] = [[float(t), float(v)] for (t, v) in series]
         
-        # Start from non-normalized dict to include optional blocks
-        base = self.to_scenario_dict()
+        # Start from non-normalized dict to include optional blocks (copied, as it is shared)
+        base = dict(self.to_scenario_dict())
         overrides_block = dict(base.get("overrides", {}))
         overrides_block["points"] = points_map
         base["overrides"] = overrides_block
+        self._scenario_dict_normalized_cache = (self._state, base)
         return base
 
     def load_from_scenario_dict(self, data: dict) -> None:
-        """Load state from a scenario dictionary."""
+        """Load state from a scenario dictionary.
+        
+        The whole load is applied as one state change (see batch()).
+        """
         if not isinstance(data, dict):
             return
-            
-        # Name
-        self._state.name = str(data.get("name") or self._state.name)
+        
+        with self.batch():
+            self._load_from_scenario_dict(data)
+    
+    def _load_from_scenario_dict(self, data: dict) -> None:
+        """Apply each block of a scenario dictionary to the state."""
+        # Name (never mutate a state object in place: it may already be shared with history)
+        self.update_state(name=str(data.get("name") or self._state.name))
         
         # Runspecs
         rs = data.get("runspecs") or {}
@@ -390,14 +445,16 @@ class StateManager:
             for name, series in points.items():
                 rows: List[Tuple[float, float]] = []
                 if isinstance(series, list):
+                    append_row = rows.append
                     for pair in series:
                         if isinstance(pair, (list, tuple)) and len(pair) == 2:
+                            t, v = pair
                             try:
-                                rows.append((float(pair[0]), float(pair[1])))
+                                append_row((float(t), float(v)))
                             except Exception:
                                 continue
                 if rows:
-                    rows.sort(key=lambda x: x[0])
+                    rows.sort(key=_POINT_TIME)
                     norm_points[str(name)] = rows
             self.update_overrides(points=norm_points)
         
@@ -429,22 +486,22 @@ class StateManager:
             
             aac = seeds.get("active_anchor_clients") or {}
             if isinstance(aac, dict):
-                new_seeds.active_anchor_clients = {str(k): int(v) for k, v in aac.items() if int(v) > 0}
+                new_seeds.active_anchor_clients = {str(k): iv for k, v in aac.items() if (iv := int(v)) > 0}
             
             eq = seeds.get("elapsed_quarters") or {}
             if isinstance(eq, dict):
-                new_seeds.elapsed_quarters = {str(k): int(v) for k, v in eq.items() if int(v) > 0}
+                new_seeds.elapsed_quarters = {str(k): iv for k, v in eq.items() if (iv := int(v)) > 0}
             
             dc = seeds.get("direct_clients") or {}
             if isinstance(dc, dict):
-                new_seeds.direct_clients = {str(k): int(v) for k, v in dc.items() if int(v) > 0}
+                new_seeds.direct_clients = {str(k): iv for k, v in dc.items() if (iv := int(v)) > 0}
             
             sm = seeds.get("active_anchor_clients_sm") or {}
             if isinstance(sm, dict):
                 norm_sm: Dict[str, Dict[str, int]] = {}
                 for s, mmap in sm.items():
                     if isinstance(mmap, dict):
-                        mm = {str(m): int(v) for m, v in mmap.items() if int(v) > 0}
+                        mm = {str(m): iv for m, v in mmap.items() if (iv := int(v)) > 0}
                         if mm:
                             norm_sm[str(s)] = mm
                 new_seeds.active_anchor_clients_sm = norm_sm
@@ -454,21 +511,21 @@ class StateManager:
                 norm_eqsm: Dict[str, Dict[str, int]] = {}
                 for s, mmap in eqsm.items():
                     if isinstance(mmap, dict):
-                        mm = {str(m): int(v) for m, v in mmap.items() if int(v) > 0}
+                        mm = {str(m): iv for m, v in mmap.items() if (iv := int(v)) > 0}
                         if mm:
                             norm_eqsm[str(s)] = mm
                 new_seeds.elapsed_quarters_sm = norm_eqsm
             
             cp = seeds.get("completed_projects") or {}
             if isinstance(cp, dict):
-                new_seeds.completed_projects = {str(k): int(v) for k, v in cp.items() if int(v) > 0}
+                new_seeds.completed_projects = {str(k): iv for k, v in cp.items() if (iv := int(v)) > 0}
             
             cpsm = seeds.get("completed_projects_sm") or {}
             if isinstance(cpsm, dict):
                 norm_cpsm: Dict[str, Dict[str, int]] = {}
                 for s, mmap in cpsm.items():
                     if isinstance(mmap, dict):
-                        mm = {str(m): int(v) for m, v in mmap.items() if int(v) > 0}
+                        mm = {str(m): iv for m, v in mmap.items() if (iv := int(v)) > 0}
                         if mm:
                             norm_cpsm[str(s)] = mm
                 new_seeds.completed_projects_sm = norm_cpsm
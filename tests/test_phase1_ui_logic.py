@@ -8,6 +8,10 @@ including state management, validation, scenario management, and data management
 import pytest
 import tempfile
 import json
+import subprocess
+import sys
+import threading
+import time
 import yaml
 from pathlib import Path
 from unittest.mock import Mock, patch
@@ -71,6 +75,35 @@ class TestStateManager:
         state = manager.get_state()
         assert state.overrides.constants == constants
     
+    def test_update_seeds_keeps_other_fields(self):
+        """Test updating one seed field leaves the others in place."""
+        manager = StateManager()
+        manager.update_seeds(elapsed_quarters_sm={"Defense": {"Product1": 2}})
+        manager.update_seeds(direct_clients={"Product1": 3})
+        
+        seeds = manager.get_state().seeds
+        assert seeds.direct_clients == {"Product1": 3}
+        assert seeds.elapsed_quarters_sm == {"Defense": {"Product1": 2}}
+    
+    def test_listeners(self):
+        """Test adding, notifying and removing state listeners."""
+        manager = StateManager()
+        calls = []
+        
+        def unsubscribing(old_state, new_state):
+            calls.append("unsubscribing")
+            manager.remove_listener("state_changed", unsubscribing)
+        
+        manager.add_listener("state_changed", unsubscribing)
+        manager.add_listener("state_changed", lambda old_state, new_state: calls.append(new_state.active_tab))
+        
+        manager.set_active_tab(TabType.LOGS)
+        manager.set_active_tab(TabType.OUTPUT)
+        manager.remove_listener("state_changed", unsubscribing)
+        manager.remove_listener("unknown_event", unsubscribing)
+        
+        assert calls == ["unsubscribing", TabType.LOGS, TabType.OUTPUT]
+    
     def test_set_active_tab(self):
         """Test setting active tab."""
         manager = StateManager()
@@ -93,6 +126,18 @@ class TestStateManager:
         assert scenario_dict["runspecs"]["starttime"] == 2025.0
         assert scenario_dict["runspecs"]["stoptime"] == 2030.0
         assert scenario_dict["overrides"]["constants"]["test_param"] == 42.0
+        
+        # Exports are reused until the state changes
+        assert manager.to_scenario_dict() is scenario_dict
+        normalized = manager.to_scenario_dict_normalized()
+        assert manager.to_scenario_dict_normalized() is normalized
+        assert "points" not in scenario_dict["overrides"]
+        
+        manager.update_runspecs(dt=0.5)
+        assert manager.to_scenario_dict()["runspecs"]["dt"] == 0.5
+        assert manager.to_scenario_dict_normalized()["runspecs"]["dt"] == 0.5
+        manager.undo()
+        assert manager.to_scenario_dict()["runspecs"]["dt"] == 0.25
     
     def test_load_from_scenario_dict(self):
         """Test loading state from scenario dictionary."""
@@ -120,6 +165,34 @@ class TestStateManager:
         assert state.runspecs.stoptime == 2030.0
         assert state.overrides.constants["test_param"] == 42.0
         assert len(state.overrides.points["test_series"]) == 2
+        
+        # The load is a single change; the earlier snapshot is left untouched
+        assert len(manager._history) == 1
+        assert manager._history[0].name == "working_scenario"
+    
+    def test_batch_coalesces_changes(self):
+        """Test a batch records one history entry and notifies once."""
+        manager = StateManager()
+        listener = Mock()
+        manager.add_listener("state_changed", listener)
+        initial_state = manager.get_state()
+        
+        with manager.batch():
+            manager.update_runspecs(dt=0.5)
+            with manager.batch():
+                manager.set_active_tab(TabType.LOGS)
+            assert listener.call_count == 0
+        
+        listener.assert_called_once_with(initial_state, manager.get_state())
+        assert list(manager._history) == [initial_state]
+        assert manager.undo()
+        assert manager.get_state() is initial_state
+        
+        # An empty batch is not a change
+        with manager.batch():
+            pass
+        assert listener.call_count == 2
+        assert not manager.can_undo()
 
 
 class TestValidationManager:
@@ -258,7 +331,8 @@ class TestScenarioManager:
                 "dt": 0.25
             },
             "overrides": {
-                "constants": {"test_param": 42.0}
+                "constants": {"test_param": 42.0},
+                "points": {"series": [[2025.0, 10.0], [2026.0, 12.5]]}
             }
         }
         
@@ -267,6 +341,8 @@ class TestScenarioManager:
         assert success
         assert path is not None
         assert path.exists()
+        # Point pairs are written in flow style, everything else in block style
+        assert "    series:\n    - [2025.0, 10.0]\n    - [2026.0, 12.5]\n" in path.read_text()
         
         # Load scenario
         success, error, loaded_data = manager.load_scenario("test_scenario")
@@ -274,6 +350,113 @@ class TestScenarioManager:
         assert loaded_data is not None
         assert loaded_data["name"] == "test_scenario"
         assert loaded_data["runspecs"]["starttime"] == 2025.0
+        
+        # A full file name is used as given
+        success, error, loaded_data = manager.load_scenario("test_scenario.yaml")
+        assert success
+        assert loaded_data["name"] == "test_scenario"
+    
+    def test_save_and_load_json_scenario(self, tmp_path):
+        """Test JSON scenarios round-trip with 2-space indentation."""
+        scenarios_dir = tmp_path / "scenarios"
+        scenarios_dir.mkdir()
+        
+        manager = ScenarioManager(scenarios_dir, Mock())
+        
+        scenario_data = {
+            "name": "json_scenario",
+            "runspecs": {"starttime": 2025.0, "dt": 0.25},
+            "overrides": {"points": {"series": [[2025.0, 1.5], [2026.0, 2.5]]}}
+        }
+        
+        success, error, path = manager.save_scenario(scenario_data, "json_scenario.json")
+        assert success
+        assert path.read_text(encoding="utf-8").startswith('{\n  "name": "json_scenario"')
+        
+        success, error, loaded_data = manager.load_scenario("json_scenario")
+        assert success
+        assert loaded_data == scenario_data
+        
+        # Malformed JSON is reported, not raised
+        (scenarios_dir / "broken.json").write_text("{")
+        success, error, loaded_data = manager.load_scenario("broken")
+        assert not success
+        assert "JSON parsing error" in error
+        assert loaded_data is None
+
+    def test_json_scenario_round_trips_non_finite_constants(self, tmp_path):
+        """Test inf/nan constants survive a JSON save and reload."""
+        scenarios_dir = tmp_path / "scenarios"
+        scenarios_dir.mkdir()
+
+        manager = ScenarioManager(scenarios_dir, Mock())
+        scenario_data = {"name": "x", "overrides": {"constants": {"k": float("inf"), "n": float("nan")}}}
+
+        success, error, path = manager.save_scenario(scenario_data, "x.json")
+        assert success
+
+        success, error, loaded_data = manager.load_scenario("x")
+        assert success
+        constants = loaded_data["overrides"]["constants"]
+        assert constants["k"] == float("inf")
+        assert constants["n"] != constants["n"]
+        assert manager.validate_scenario_data(loaded_data) == (True, None)
+
+    def test_load_scenario_uses_parse_cache(self, tmp_path):
+        """Test unchanged files are parsed once and callers get independent copies."""
+        scenarios_dir = tmp_path / "scenarios"
+        scenarios_dir.mkdir()
+        
+        manager = ScenarioManager(scenarios_dir, Mock())
+        manager.save_scenario({"name": "cached", "runspecs": {"dt": 0.25}}, "cached.yaml")
+        
+        with patch("src.ui_logic.scenario_manager.yaml.load", wraps=yaml.load) as load:
+            _, _, first = manager.load_scenario("cached")
+            first["runspecs"]["dt"] = 1.0
+            _, _, second = manager.load_scenario("cached")
+            assert load.call_count == 1
+            assert second["runspecs"]["dt"] == 0.25
+            
+            # Saving over the file invalidates the cached parse
+            manager.save_scenario({"name": "cached", "runspecs": {"dt": 0.5}}, "cached.yaml", overwrite=True)
+            _, _, third = manager.load_scenario("cached")
+            assert load.call_count == 2
+            assert third["runspecs"]["dt"] == 0.5
+    
+    def test_scenario_summary_uses_index(self, tmp_path):
+        """Test the summary reuses indexed info and only parses changed files."""
+        scenarios_dir = tmp_path / "scenarios"
+        scenarios_dir.mkdir()
+        
+        manager = ScenarioManager(scenarios_dir, Mock())
+        manager.save_scenario({"name": "a", "overrides": {"constants": {"x": 1.0}}}, "a.yaml")
+        manager.save_scenario({"name": "b"}, "b.json")
+        (scenarios_dir / "c.yaml").write_text("name: c\nseeds:\n  direct_clients:\n    P: 1\n")
+        
+        summary = manager.get_scenario_summary()
+        assert summary["total_scenarios"] == 3
+        infos = {entry["name"]: entry["info"] for entry in summary["scenarios"]}
+        assert infos["a"]["constants_count"] == 1
+        assert infos["c"]["has_seeds"]
+        assert (scenarios_dir / ".index.json").exists()
+        assert [p.name for p in manager.list_available_scenarios()] == ["a.yaml", "b.json", "c.yaml"]
+        assert sorted(manager.iter_available_scenarios()) == manager.list_available_scenarios()
+        
+        # A fresh manager answers from the index without parsing
+        manager = ScenarioManager(scenarios_dir, Mock())
+        with patch.object(manager, "_load_scenario_file", wraps=manager._load_scenario_file) as load_file:
+            assert manager.get_scenario_summary() == summary
+            assert load_file.call_count == 0
+            
+            manager.delete_scenario("b")
+            (scenarios_dir / "c.yaml").write_text("name: c2\n")
+            summary = manager.get_scenario_summary()
+            assert load_file.call_count == 1
+        
+        infos = {entry["name"]: entry["info"] for entry in summary["scenarios"]}
+        assert sorted(infos) == ["a", "c"]
+        assert infos["c"]["name"] == "c2"
+        assert not infos["c"]["has_seeds"]
     
     def test_duplicate_scenario(self, tmp_path):
         """Test duplicating a scenario."""
@@ -296,6 +479,38 @@ class TestScenarioManager:
         assert success
         assert duplicate_data["name"] == "duplicate"
     
+    def test_duplicate_loaded_scenario_copies_file(self, tmp_path):
+        """Test duplicating a loaded YAML scenario keeps its content and renames it."""
+        scenarios_dir = tmp_path / "scenarios"
+        scenarios_dir.mkdir()
+        
+        manager = ScenarioManager(scenarios_dir, Mock())
+        source_text = '# Team baseline\nname: "original"\nrunspecs:\n  starttime: 2025.0\n'
+        (scenarios_dir / "original.yaml").write_text(source_text)
+        manager.load_scenario("original")
+        
+        success, error, path = manager.duplicate_scenario("original", "copy of original")
+        assert success
+        assert path == scenarios_dir / "copy of original.yaml"
+        assert path.read_text() == source_text.replace('name: "original"', "name: copy of original")
+        
+        success, error, duplicate_data = manager.load_scenario("copy of original")
+        assert duplicate_data == {"name": "copy of original", "runspecs": {"starttime": 2025.0}}
+        
+        # Existing targets are still refused
+        success, error, path = manager.duplicate_scenario("original", "copy of original")
+        assert not success
+        assert "already exists" in error
+
+        # An anchored name falls back to load and re-save, so the alias still resolves
+        (scenarios_dir / "anchored.yaml").write_text('name: &n anchored\ndescription: *n\n')
+        manager.load_scenario("anchored")
+        success, error, path = manager.duplicate_scenario("anchored", "copy of anchored")
+        assert success
+        success, error, duplicate_data = manager.load_scenario("copy of anchored")
+        assert success
+        assert duplicate_data == {"name": "copy of anchored", "description": "anchored"}
+
     def test_validate_scenario_data(self, tmp_path):
         """Test scenario data validation."""
         scenarios_dir = tmp_path / "scenarios"
@@ -413,6 +628,10 @@ class TestDataManager:
         assert error is None
         assert bundle is not None
         assert isinstance(bundle, DataBundle)
+        assert manager.get_primary_map_start_years() == {
+            "Defense": [("Product1", 2025.0)],
+            "Aviation": [("Product2", 2026.0)],
+        }
     
     def test_get_permissible_keys(self, tmp_path):
         """Test getting permissible keys."""
@@ -446,6 +665,97 @@ class TestDataManager:
         assert "Defense" in keys.sectors
         assert "Product1" in keys.products
     
+    def test_sm_permissible_keys_with_extra_pairs(self, tmp_path):
+        """Test SM-mode keys include extra pairs without mutating bundle lists."""
+        state_manager = Mock()
+        manager = DataManager(state_manager, tmp_path)
+
+        bundle = DataBundle(
+            lists={"lists": {"markets": ["US"], "sectors": ["Defense"], "products": ["Product1"]}},
+            anchor_params={}, other_params={}, production={}, pricing={}, primary_map={}
+        )
+        constants = manager._generate_constant_keys(bundle, "sm", [("Aviation", "Product2")])
+
+        assert "anchor_start_year_Defense_Product1" in constants
+        assert "ATAM_Aviation_Product2" in constants
+        assert "requirement_to_order_lag_Defense_Product2" in constants
+        assert "TAM_Product2" in constants
+        assert bundle.lists["lists"]["sectors"] == ["Defense"]
+        assert bundle.lists["lists"]["products"] == ["Product1"]
+
+    def test_permissible_keys_cache_keyed_on_arguments(self, tmp_path):
+        """Test permissible keys are cached per (anchor_mode, extra pairs) and bounded."""
+        from src.ui_logic import data_manager as dm
+
+        state_manager = Mock()
+        manager = DataManager(state_manager, tmp_path)
+        manager._data_bundle = DataBundle(
+            lists={"lists": {"markets": ["US"], "sectors": ["Defense"], "products": ["Product1"]}},
+            anchor_params={}, other_params={}, production={}, pricing={}, primary_map={}
+        )
+
+        base = manager.get_permissible_keys("sm")
+        extra = manager.get_permissible_keys("sm", [("Aviation", "Product2")])
+        assert manager.get_permissible_keys("sm") is base
+        assert manager.get_permissible_keys("sm", [["Aviation", "Product2"]]) is extra
+        assert "ATAM_Aviation_Product2" in extra.constants
+        assert "ATAM_Aviation_Product2" not in base.constants
+
+        for i in range(dm._PERMISSIBLE_KEYS_CACHE_SIZE + 5):
+            manager.get_permissible_keys("sm", [("Defense", f"P{i}")])
+        assert len(manager._permissible_keys_cache) == dm._PERMISSIBLE_KEYS_CACHE_SIZE
+
+    def test_derived_views_cached_until_clear(self, tmp_path):
+        """Test inverted params and sorted series are built once per bundle load."""
+        state_manager = Mock()
+        manager = DataManager(state_manager, tmp_path)
+        manager._data_bundle = DataBundle(
+            lists={"lists": {"markets": ["US"], "sectors": ["Defense"], "products": ["Product1"]}},
+            anchor_params={"Defense": {"param1": 1.0}},
+            other_params={"Product1": {"param3": 3.0}},
+            production={"Product1": {"2026": 20.0, "2025": "10", "bad": 1.0}},
+            pricing={"Product1": {"2025": 100.0}},
+            primary_map={}
+        )
+
+        anchor = manager.get_anchor_params()
+        assert anchor == {"param1": {"Defense": 1.0}}
+        assert manager.get_anchor_params() is anchor
+        assert manager.get_other_params() == {"param3": {"Product1": 3.0}}
+        assert manager.get_production_data_for_product("Product1") == [(2025.0, 10.0), (2026.0, 20.0)]
+        assert manager.get_pricing_data_for_product("Missing") == []
+
+        manager._data_bundle.anchor_params["Defense"]["param1"] = 5.0
+        assert manager.get_anchor_params() is anchor
+        manager.clear_cache()
+        assert manager.get_anchor_params() == {"param1": {"Defense": 5.0}}
+        
+        # SM parameters are optional and attached after construction
+        assert manager.get_sm_params() == {}
+        manager._data_bundle.anchor_params_sm = {"param_sm": {"Defense": {"Product1": 7.0}}}
+        manager.clear_cache()
+        sm_params = manager.get_sm_params()
+        assert sm_params == {"param_sm": {"Defense": {"Product1": 7.0}}}
+        assert manager.get_sm_params() is sm_params
+
+    def test_failed_load_not_retried_until_file_changes(self, tmp_path):
+        """Test get_data_bundle caches a load failure until inputs.json changes."""
+        state_manager = Mock()
+        manager = DataManager(state_manager, tmp_path)
+
+        with patch.object(manager, "_read_data_bundle", wraps=manager._read_data_bundle) as read:
+            assert manager.get_data_bundle() is None
+            assert manager.get_data_bundle() is None
+            assert read.call_count == 1
+
+            inputs_data = {
+                "lists": {"lists": {"markets": ["US"], "sectors": ["Defense"], "products": ["Product1"]}},
+                "anchor_params": {}, "other_params": {}, "production": {}, "pricing": {}, "primary_map": {}
+            }
+            (tmp_path / "inputs.json").write_text(json.dumps(inputs_data))
+            assert manager.get_data_bundle() is not None
+            assert read.call_count == 2
+
     def test_get_available_sectors_and_products(self, tmp_path):
         """Test getting available sectors and products."""
         state_manager = Mock()
@@ -534,7 +844,125 @@ class TestRunnerManager:
         assert isinstance(status, manager.current_status.__class__)
         assert not status.is_running
         assert status.exit_code is None
+        assert "log_lines" not in status.to_status_dict()
+        assert status.to_dict()["log_lines"] == []
+    
+    def test_parse_progress(self, tmp_path):
+        """Test progress parsing from step and time log lines."""
+        state_manager = Mock()
+        state_manager.get_state.return_value.runspecs.starttime = 2025.0
+        state_manager.get_state.return_value.runspecs.stoptime = 2035.0
+        manager = RunnerManager(state_manager, tmp_path)
+
+        manager._parse_progress("INFO: Step 3 of 12 complete")
+        assert manager.current_status.progress == 0.25
+        assert manager.current_status.current_step == "Step 3/12"
+
+        manager._parse_progress("TIME = 2030.0")
+        assert manager.current_status.progress == 0.5
+        assert manager.current_status.current_step == "Time: 2030.00"
+
+        manager._parse_progress("no progress here")
+        assert manager.current_status.progress == 0.5
+
+    def test_status_callbacks(self, tmp_path):
+        """Test status callback registration and removal of failing callbacks."""
+        from src.ui_logic import runner_manager as rm
+
+        manager = RunnerManager(Mock(), tmp_path)
+        seen = []
+        good = seen.append
+
+        def bad(status):
+            raise RuntimeError("boom")
+
+        manager.add_status_callback(good)
+        manager.add_status_callback(bad)
+        for _ in range(rm._MAX_CALLBACK_FAILURES):
+            manager._notify_status_callbacks()
+
+        assert len(seen) == rm._MAX_CALLBACK_FAILURES
+        assert list(manager._status_callbacks) == [good]
+
+        manager.remove_status_callback(good)
+        manager.remove_status_callback(good)
+        manager._notify_status_callbacks()
+        assert len(seen) == rm._MAX_CALLBACK_FAILURES
+
+    def test_temp_scenario_kept_while_unmonitored_run_is_alive(self, tmp_path):
+        """Test the temp scenario outlives the child when no new monitor could take it."""
+        (tmp_path / "scenarios").mkdir()
+        state_manager = Mock()
+        state_manager.to_scenario_dict_normalized.return_value = {"name": "temp"}
+        manager = RunnerManager(state_manager, tmp_path)
+        # A previous monitor that did not finish within stop_simulation's join timeout
+        manager._log_monitor_thread = Mock(is_alive=Mock(return_value=True))
+        
+        exited = threading.Event()
+        process = Mock(pid=4242)
+        process.wait.side_effect = lambda *args, **kwargs: exited.wait()
+        with patch("src.ui_logic.runner_manager.subprocess.Popen", return_value=process):
+            success, error = manager.run_current_scenario()
+        
+        assert success
+        temp_files = list((tmp_path / "scenarios").glob("temp_*.yaml"))
+        assert len(temp_files) == 1
+        
+        exited.set()
+        deadline = time.monotonic() + 2
+        while temp_files[0].exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert not temp_files[0].exists()
+    
+    def test_monitor_logs_reports_lines_while_child_is_silent(self, tmp_path):
+        """Test _monitor_logs splits raw output and reports it before the child's next write."""
+        child = (
+            "import sys, time\n"
+            "for i in (1, 2, 3):\n"
+            "    print(f'step {i} of 10', flush=True)\n"
+            "    time.sleep(0.01)\n"
+            "sys.stdout.buffer.write(b'bad \\xff byte\\rcarriage\\nunterminated step 4 of 10')\n"
+            "sys.stdout.flush()\n"
+            "time.sleep(1.0)\n"
+        )
+        manager = RunnerManager(Mock(), tmp_path)
+        manager.current_process = subprocess.Popen([sys.executable, "-c", child], stdout=subprocess.PIPE)
+        seen = []
+        manager.add_status_callback(lambda status: seen.append((status.progress, list(status.log_lines))))
+        
+        monitor = threading.Thread(target=manager._monitor_logs, daemon=True)
+        monitor.start()
+        # While the child computes silently, the last progress and lines have been reported
+        deadline = time.monotonic() + 0.8
+        while not (seen and seen[-1][1][-2:] == ["bad \ufffd byte", "carriage"]) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert seen[-1][0] == pytest.approx(0.3)
+        assert seen[-1][1] == ["step 1 of 10", "step 2 of 10", "step 3 of 10", "bad \ufffd byte", "carriage"]
+        assert monitor.is_alive()
+        
+        # The unterminated final line is flushed at EOF
+        monitor.join(timeout=5)
+        assert not monitor.is_alive()
+        assert manager.current_status.log_lines[-1] == "unterminated step 4 of 10"
+        assert manager.current_status.progress == pytest.approx(0.4)
+        assert manager.current_status.exit_code == 0
+        assert not manager.current_status.is_running
     
+    def test_read_log_file_tail(self, tmp_path):
+        """Test reading the log tail, tolerating malformed UTF-8."""
+        manager = RunnerManager(Mock(), tmp_path)
+        assert manager.read_log_file() == []
+
+        log_dir = tmp_path / "logs"
+        log_dir.mkdir()
+        lines = [f"line {i}" for i in range(50)]
+        (log_dir / "run.log").write_bytes(
+            ("\n".join(lines) + "\n\n").encode("utf-8") + b"bad \xff byte\n"
+        )
+
+        assert manager.read_log_file(max_lines=3) == ["line 49", "bad � byte"]
+        assert manager.read_log_file(max_lines=100)[:2] == ["line 0", "line 1"]
+
     def test_get_latest_results_no_results(self, tmp_path):
         """Test getting latest results when none exist."""
         state_manager = Mock()
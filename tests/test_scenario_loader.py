@@ -1,10 +1,12 @@
+import copy
 import json
 from pathlib import Path
+import pickle
 import tempfile
 import unittest
 
 from src.phase1_data import load_phase1_inputs
-from src.scenario_loader import load_and_validate_scenario
+from src.scenario_loader import build_scenario_validator, load_and_validate_scenario, validate_scenario_dict
 
 
 class TestScenarioLoader(unittest.TestCase):
@@ -92,7 +94,7 @@ overrides:
         try:
             scenario = load_and_validate_scenario(p, bundle=self.bundle)
             pts = scenario.points[lookup_name]
-            self.assertEqual(pts, [(2025.0, 5.0), (2026.0, 7.0), (2027.0, 10.0)])
+            self.assertEqual(pts, ((2025.0, 5.0), (2026.0, 7.0), (2027.0, 10.0)))
         finally:
             p.unlink(missing_ok=True)
 
@@ -114,6 +116,50 @@ overrides:
         finally:
             p.unlink(missing_ok=True)
 
+    def test_seed_counts_coerced_and_validated(self):
+        sector = self.bundle.lists.sectors[0]
+        good = {"name": "seeds-ok", "seeds": {"active_anchor_clients": {sector: "3"}, "completed_projects": {sector: 2.0}}}
+        p = self._write_temp(json.dumps(good), ".json")
+        try:
+            scenario = load_and_validate_scenario(p, bundle=self.bundle)
+            self.assertEqual(scenario.seeds_active_anchor_clients, {sector: 3})
+            self.assertEqual(scenario.seeds_completed_projects, {sector: 2})
+        finally:
+            p.unlink(missing_ok=True)
+        huge = {"name": "seeds-huge", "seeds": {"active_anchor_clients": {sector: 1e19}}}
+        self.assertEqual(validate_scenario_dict(self.bundle, huge).seeds_active_anchor_clients, {sector: 10**19})
+        for bad_value in (-1, 1.5):
+            bad = {"name": "seeds-bad", "seeds": {"active_anchor_clients": {sector: bad_value}}}
+            p = self._write_temp(json.dumps(bad), ".json")
+            try:
+                with self.assertRaisesRegex(ValueError, "must be a non-negative integer"):
+                    load_and_validate_scenario(p, bundle=self.bundle)
+            finally:
+                p.unlink(missing_ok=True)
+
+    def test_bundle_validator_matches_generic_path(self):
+        product = self.bundle.lists.products[0]
+        lookup_name = f"price_{product.replace(' ', '_')}"
+        scenario_dict = {"name": "sweep", "overrides": {"points": {lookup_name: [[2026.0, 2], [2025.0, 1]]}}}
+        validate = build_scenario_validator(self.bundle)
+        self.assertEqual(validate(scenario_dict), validate_scenario_dict(self.bundle, scenario_dict))
+        with self.assertRaisesRegex(ValueError, "unknown keys"):
+            validate({"overrides": {"constants": {"not_a_constant": 1}}})
+
+    def test_scenario_pickles_and_deep_copies(self):
+        product = self.bundle.lists.products[0]
+        lookup_name = f"price_{product.replace(' ', '_')}"
+        scenario = validate_scenario_dict(
+            self.bundle, {"name": "pickled", "overrides": {"points": {lookup_name: [[2025.0, 1], [2026.0, 2]]}}}
+        )
+        for clone in (pickle.loads(pickle.dumps(scenario)), copy.deepcopy(scenario)):
+            self.assertEqual(clone.name, "pickled")
+            self.assertEqual(clone.runspecs, scenario.runspecs)
+            self.assertEqual(dict(clone.points), dict(scenario.points))
+            self.assertEqual(dict(clone.constants), dict(scenario.constants))
+            with self.assertRaises(TypeError):
+                clone.points[lookup_name] = ()
+
 
 if __name__ == "__main__":
     unittest.main()